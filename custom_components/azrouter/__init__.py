@@ -25,11 +25,14 @@ from homeassistant.exceptions import (
     HomeAssistantError,
 )
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers import device_registry as dr
 
 from .const import DOMAIN, PLATFORMS, DEFAULT_SCAN_INTERVAL
 from .api import AzRouterClient
+from .devices.number import DeviceSettingsWriteBus, ServiceWriteCoalescer
+from .devices.switch import async_set_device_boosts
 from .devices.device_type_4.helpers import (
     MODE_HDO,
     MODE_PRIORITIZE_WHEN_CONNECTED,
@@ -46,6 +49,15 @@ DEVICE_TYPE_MODEL: Dict[str, str] = {
     "5": "Inverter",
 }
 
+# Delay (s) used to merge async_request_refresh() calls into one refresh
+REQUEST_REFRESH_COOLDOWN = 0.35
+
+# Delay (s) before refreshing after entity writes, gives the API time to settle
+WRITE_REFRESH_DELAY = 4.5
+
+# Quiet time (s) after which rapid repeated number service calls are written
+SERVICE_COALESCE_DELAY = 0.25
+
 SERVICE_SET_MASTER_BOOST = "set_master_boost"
 SERVICE_SET_DEVICE_BOOST = "set_device_boost"
 SERVICE_SET_DEVICE_TYPE_1_KEEP_HEATED = "set_device_type_1_keep_heated"
@@ -58,6 +70,7 @@ SERVICE_SET_DEVICE_TYPE_1_BOOST_MODE = "set_device_type_1_boost_mode"
 SERVICE_SET_DEVICE_TYPE_1_CONNECTED_PHASE = "set_device_type_1_connected_phase"
 SERVICE_SET_DEVICE_TYPE_1_TEMPS = "set_device_type_1_temperatures"
 SERVICE_SET_DEVICE_TYPE_1_MAX_POWER = "set_device_type_1_max_power"
+SERVICE_SET_DEVICE_TYPE_1_SETTINGS = "set_device_type_1_settings"
 SERVICE_SET_DEVICE_TYPE_4_BLOCK_CHARGING = "set_device_type_4_block_charging"
 SERVICE_SET_DEVICE_TYPE_4_PRIORITIZE_WHEN_CONNECTED = (
     "set_device_type_4_prioritize_when_connected"
@@ -90,6 +103,9 @@ class AzRouterRuntimeData:
 
     client: AzRouterClient
     coordinator: DataUpdateCoordinator
+    write_bus: DeviceSettingsWriteBus
+    refresh_debouncer: Debouncer
+    service_writes: ServiceWriteCoalescer
 
 
 def _friendly_device_prefix(dtype: str) -> str:
@@ -146,6 +162,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         name=DOMAIN,
         update_method=client.async_get_all_data,
         update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        # collapse refresh requests from several entities/services into one
+        request_refresh_debouncer=Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=REQUEST_REFRESH_COOLDOWN,
+            immediate=False,
+        ),
     )
 
     # 3) first refresh
@@ -159,7 +182,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady(f"Failed initial data refresh for {host}") from err
 
     # 4) persist runtime references for platforms
-    entry.runtime_data = AzRouterRuntimeData(client=client, coordinator=coordinator)
+    entry.runtime_data = AzRouterRuntimeData(
+        client=client,
+        coordinator=coordinator,
+        write_bus=DeviceSettingsWriteBus(hass, client),
+        # several entity writes (e.g. from a scene) -> one delayed refresh
+        refresh_debouncer=Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=WRITE_REFRESH_DELAY,
+            immediate=False,
+            function=coordinator.async_request_refresh,
+        ),
+        service_writes=ServiceWriteCoalescer(hass, SERVICE_COALESCE_DELAY),
+    )
 
     # 5) forward platform setups (sensor, switch, number, ...)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -383,13 +419,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             enabled,
         )
 
-        for az_device_id in az_ids:
-            _LOGGER.debug(
-                "Calling async_set_device_boost(az_device_id=%s, enabled=%s)",
-                az_device_id,
-                enabled,
-            )
-            await client.async_set_device_boost(az_device_id, enabled)
+        # one parallel round of requests instead of one request after another
+        await async_set_device_boosts(client, az_ids, enabled)
 
         await coordinator.async_request_refresh()
 
@@ -468,16 +499,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
         # Import inside handler to avoid cyclic imports
-        from .number import async_service_set_device_type_1_max_power
+        from .number import async_service_for_devices, async_service_set_device_type_1_max_power
 
-        for az_device_id in az_ids:
-            await async_service_set_device_type_1_max_power(
-                hass=hass,
-                client=client,
-                coordinator=coordinator,
-                device_id=az_device_id,
-                max_power=max_power,
-            )
+        # all selected devices are written concurrently
+        await async_service_for_devices(
+            async_service_set_device_type_1_max_power,
+            az_ids,
+            coalescer=entry.runtime_data.service_writes,
+            hass=hass,
+            client=client,
+            coordinator=coordinator,
+            max_power=max_power,
+        )
 
         await coordinator.async_request_refresh()
 
@@ -500,17 +533,57 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             boost_temperature,
         )
 
-        from .number import async_service_set_device_type_1_temperatures
+        from .number import async_service_for_devices, async_service_set_device_type_1_temperatures
 
-        for az_device_id in az_ids:
-            await async_service_set_device_type_1_temperatures(
-                hass=hass,
-                client=client,
-                coordinator=coordinator,
-                device_id=az_device_id,
-                target_temperature=target_temperature,
-                boost_temperature=boost_temperature,
-            )
+        # all selected devices are written concurrently
+        await async_service_for_devices(
+            async_service_set_device_type_1_temperatures,
+            az_ids,
+            coalescer=entry.runtime_data.service_writes,
+            hass=hass,
+            client=client,
+            coordinator=coordinator,
+            target_temperature=target_temperature,
+            boost_temperature=boost_temperature,
+        )
+
+        await coordinator.async_request_refresh()
+
+    async def handle_set_device_type_1_settings(call):
+        """Service handler azrouter.set_device_type_1_settings.
+
+        - max_power / target_temperature / boost_temperature: all optional
+        - everything given is written to each device with one POST
+        """
+        max_power = call.data.get("max_power")
+        target_temperature = call.data.get("target_temperature")
+        boost_temperature = call.data.get("boost_temperature")
+        az_ids = _resolve_az_device_ids_from_call(call)
+
+        _LOGGER.debug(
+            "Service %s called for AZ devices=%s, max_power=%s, "
+            "target_temperature=%s, boost_temperature=%s",
+            SERVICE_SET_DEVICE_TYPE_1_SETTINGS,
+            az_ids,
+            max_power,
+            target_temperature,
+            boost_temperature,
+        )
+
+        from .number import async_service_for_devices, async_service_set_device_type_1_all
+
+        # all selected devices are written concurrently
+        await async_service_for_devices(
+            async_service_set_device_type_1_all,
+            az_ids,
+            coalescer=entry.runtime_data.service_writes,
+            hass=hass,
+            client=client,
+            coordinator=coordinator,
+            max_power=max_power,
+            target_temperature=target_temperature,
+            boost_temperature=boost_temperature,
+        )
 
         await coordinator.async_request_refresh()
 
@@ -668,6 +741,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             SERVICE_SET_DEVICE_TYPE_1_TEMPS,
             handle_set_device_type_1_temperatures,
         )
+    if not hass.services.has_service(DOMAIN, SERVICE_SET_DEVICE_TYPE_1_SETTINGS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_SET_DEVICE_TYPE_1_SETTINGS,
+            handle_set_device_type_1_settings,
+        )
 
     # =====================================================================================
     #   SERVICES FOR DEVICE_TYPE_4 (Wallbox)
@@ -797,16 +876,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             manual_power,
         )
 
-        from .number import async_service_set_device_type_4_manual_power
+        from .number import async_service_for_devices, async_service_set_device_type_4_manual_power
 
-        for az_device_id in az_ids:
-            await async_service_set_device_type_4_manual_power(
-                hass=hass,
-                client=client,
-                coordinator=coordinator,
-                device_id=az_device_id,
-                manual_power=manual_power,
-            )
+        # all selected devices are written concurrently
+        await async_service_for_devices(
+            async_service_set_device_type_4_manual_power,
+            az_ids,
+            coalescer=entry.runtime_data.service_writes,
+            hass=hass,
+            client=client,
+            coordinator=coordinator,
+            manual_power=manual_power,
+        )
 
         await coordinator.async_request_refresh()
 
@@ -891,6 +972,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry and cleanup resources."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
+        runtime_data = getattr(entry, "runtime_data", None)
+        if runtime_data is not None:
+            runtime_data.write_bus.cancel()
+            runtime_data.refresh_debouncer.async_shutdown()
+            runtime_data.service_writes.cancel()
+
         # If no more entries for this integration exist, remove services
         remaining_entries = hass.config_entries.async_entries(DOMAIN)
         if len(remaining_entries) <= 1:
@@ -914,6 +1001,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 )
                 hass.services.async_remove(DOMAIN, SERVICE_SET_DEVICE_TYPE_1_MAX_POWER)
                 hass.services.async_remove(DOMAIN, SERVICE_SET_DEVICE_TYPE_1_TEMPS)
+                hass.services.async_remove(DOMAIN, SERVICE_SET_DEVICE_TYPE_1_SETTINGS)
                 hass.services.async_remove(
                     DOMAIN, SERVICE_SET_DEVICE_TYPE_4_BLOCK_CHARGING
                 )
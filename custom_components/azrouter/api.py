@@ -9,7 +9,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 import copy
 
@@ -34,6 +34,24 @@ FULL_REFRESH_RETRY_DELAY = 0.75
 FULL_REFRESH_ENDPOINT_COUNT = 4
 
 
+def _valid_devices(raw: List[Any]) -> List[Dict[str, Any]]:
+    """Keep well-formed device entries from a /devices response.
+
+    Every entry must be a dict with a dict "common" section; anything else is
+    dropped here (logged once), so consumers do not have to re-check types.
+    """
+    devices = [
+        dev for dev in raw
+        if isinstance(dev, dict) and isinstance(dev.get("common"), dict)
+    ]
+    if len(devices) != len(raw):
+        _LOGGER.warning(
+            "ignoring %d malformed device entries in /devices response",
+            len(raw) - len(devices),
+        )
+    return devices
+
+
 class AzRouterClient:
     """Async client for AZ Router API."""
 
@@ -175,11 +193,11 @@ class AzRouterClient:
         data = await self._api_get(API_DEVICES)
 
         if isinstance(data, list):
-            return data
+            return _valid_devices(data)
         if isinstance(data, dict):
             lst = data.get("devices")
             if isinstance(lst, list):
-                return lst
+                return _valid_devices(lst)
         return []
 
     async def async_get_settings(self) -> Dict[str, Any]:
@@ -272,9 +290,32 @@ class AzRouterClient:
         _flatten(power, "power", master_list)
         _flatten(status, "status", master_list)
 
+        # path -> value lookup for entities reading a single master path
+        master_index = {item["path"]: item["value"] for item in master_list}
+
+        # aggregated grid power over all phases (power.input.power.<idx>.value)
+        input_power_total = 0
+        for path, value in master_index.items():
+            if path.startswith("power.input.power.") and path.endswith(".value"):
+                try:
+                    input_power_total += value or 0
+                except Exception:
+                    continue
+
+        # (deviceType, common.id) as strings -> device dict; ids are only
+        # unique within one device type. A missing id is indexed as "None",
+        # the same key device entities build from str(None).
+        devices_by_key: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for dev in devices:
+            key = (str(dev.get("deviceType", "unknown")), str(dev["common"].get("id")))
+            devices_by_key.setdefault(key, dev)
+
         return {
             "master_data": master_list,
+            "master_index": master_index,
+            "input_power_total": input_power_total,
             "devices": devices,
+            "devices_by_key": devices_by_key,
             "settings": settings,
         }, len(failures)
 
@@ -318,10 +359,7 @@ class AzRouterClient:
             return
 
         # clamp using const
-        if value < MASTER_TARGET_POWER_MIN:
-            value = MASTER_TARGET_POWER_MIN
-        elif value > MASTER_TARGET_POWER_MAX:
-            value = MASTER_TARGET_POWER_MAX
+        value = min(max(value, MASTER_TARGET_POWER_MIN), MASTER_TARGET_POWER_MAX)
 
         settings = await self.async_get_settings()
         regulation = settings.setdefault("regulation", {})
@@ -11,9 +11,6 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 import logging
-import asyncio
-import copy
-from time import monotonic
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.const import UnitOfTemperature, UnitOfPower
@@ -121,6 +118,7 @@ class DeviceType1TempBase(DeviceNumberBase):
 
     _DEBOUNCE_SECONDS = 2.0
     _WRITE_GRACE_SECONDS = 6.0
+    _BATCHED_WRITES = True
 
     # set in subclasses
     _setting_key: str = ""
@@ -157,19 +155,12 @@ class DeviceType1TempBase(DeviceNumberBase):
 
         self._value: Optional[int] = None
 
-        # debounce state
-        self._pending_value: Optional[int] = None
-        self._debounce_task: Optional[asyncio.Task] = None
-
     # ---------------------------------------------------------------------
     # Helpers – coordinator access
     # ---------------------------------------------------------------------
 
     def _clamp(self, value: int) -> int:
-        if value < MIN_TEMP:
-            value = MIN_TEMP
-        if value > MAX_TEMP:
-            value = MAX_TEMP
+        value = min(max(value, MIN_TEMP), MAX_TEMP)
         # align to step
         rest = (value - MIN_TEMP) % STEP_TEMP
         if rest != 0:
@@ -240,11 +231,6 @@ class DeviceType1TempBase(DeviceNumberBase):
         self._update_from_coordinator()
         self.async_write_ha_state()
 
-    async def async_will_remove_from_hass(self) -> None:
-        if self._debounce_task and not self._debounce_task.done():
-            self._debounce_task.cancel()
-        await super().async_will_remove_from_hass()
-
     def _handle_coordinator_update(self) -> None:
         """
         Called on each coordinator refresh.
@@ -261,77 +247,34 @@ class DeviceType1TempBase(DeviceNumberBase):
     def native_value(self) -> Optional[float]:
         return float(self._value) if self._value is not None else None
 
-    async def async_set_native_value(self, value: float) -> None:
-        """Set value in HA and send to device with debounce."""
-        int_val = self._clamp(int(round(value)))
-        self._value = int_val
-        self._pending_value = int_val
-        self._suppress_coordinator_until = (
-            monotonic() + self._DEBOUNCE_SECONDS + self._WRITE_GRACE_SECONDS
-        )
-        self.async_write_ha_state()
+    # ---------------------------------------------------------------------
+    # Writes (batched per device by DeviceSettingsWriteBus)
+    # ---------------------------------------------------------------------
 
-        # cancel previous task if running
-        if self._debounce_task and not self._debounce_task.done():
-            self._debounce_task.cancel()
+    def _find_device_payload(self) -> Optional[Dict[str, Any]]:
+        return self._find_device_from_coordinator()
 
-        async def _send_later() -> None:
-            try:
-                await asyncio.sleep(self._DEBOUNCE_SECONDS)
-                if self._pending_value is None or not self._setting_key:
-                    return
-
-                dev = self._find_device_from_coordinator()
-                if not dev:
-                    _LOGGER.warning(
-                        "Cannot send %s for device_type_1 id=%s – device not found in coordinator",
-                        self._setting_key,
-                        self._device_id,
-                    )
-                    return
-
-                # copy unit JSON and update settings[*].power[setting_key]
-                dev_payload = copy.deepcopy(dev)
-                settings_list = dev_payload.setdefault("settings", [])
-
-                if not isinstance(settings_list, list) or not settings_list:
-                    # fallback: minimal 2 entries (summer/winter)
-                    settings_list = [{"power": {}}, {"power": {}}]
-                    dev_payload["settings"] = settings_list
-
-                for s in settings_list:
-                    power = s.setdefault("power", {})
-                    power[self._setting_key] = int(self._pending_value)
-
-                _LOGGER.debug(
-                    "Debounced send device_type_1 %s=%s (id=%s)",
-                    self._setting_key,
-                    self._pending_value,
-                    self._device_id,
-                )
-
-                await self._client.async_post_device_settings(dev_payload)
-                self._suppress_coordinator_until = max(
-                    self._suppress_coordinator_until,
-                    monotonic() + self._WRITE_GRACE_SECONDS,
-                )
-
-            except asyncio.CancelledError:
-                _LOGGER.debug(
-                    "Debounced send cancelled for %s (id=%s)",
-                    self._setting_key,
-                    self._device_id,
-                )
-            except Exception as exc:
-                self._suppress_coordinator_until = 0.0
-                _LOGGER.warning(
-                    "Failed to send device_type_1 %s (id=%s): %s",
-                    self._setting_key,
-                    self._device_id,
-                    exc,
-                )
-
-        self._debounce_task = self.hass.loop.create_task(_send_later())
+    def _apply_value(self, payload: Dict[str, Any], value: float | int) -> None:
+        """Write settings[*].power[setting_key] into a copy of the unit JSON."""
+        if not self._setting_key:
+            raise ValueError("setting key is not defined")
+
+        settings_list = payload.setdefault("settings", [])
+        if not isinstance(settings_list, list) or not settings_list:
+            # fallback: minimal 2 entries (summer/winter)
+            settings_list = [{"power": {}}, {"power": {}}]
+            payload["settings"] = settings_list
+
+        for s in settings_list:
+            power = s.setdefault("power", {})
+            power[self._setting_key] = int(value)
+
+        _LOGGER.debug(
+            "Debounced send device_type_1 %s=%s (id=%s)",
+            self._setting_key,
+            int(value),
+            self._device_id,
+        )
 
 
 class DeviceType1TargetTemperatureNumber(DeviceType1TempBase):
@@ -363,6 +306,7 @@ class DeviceType1MaxPowerNumber(DeviceNumberBase):
 
     _DEBOUNCE_SECONDS = 2.0
     _WRITE_GRACE_SECONDS = 6.0
+    _BATCHED_WRITES = True
 
     def __init__(
         self,
@@ -394,16 +338,11 @@ class DeviceType1MaxPowerNumber(DeviceNumberBase):
         self._device_type = DEVICE_TYPE_1
 
         self._value: Optional[int] = None
-        self._pending_value: Optional[int] = None
-        self._debounce_task: Optional[asyncio.Task] = None
 
     # ------- helpers -------
 
     def _clamp(self, value: int) -> int:
-        if value < MIN_MAXPOWER:
-            value = MIN_MAXPOWER
-        if value > MAX_MAXPOWER:
-            value = MAX_MAXPOWER
+        value = min(max(value, MIN_MAXPOWER), MAX_MAXPOWER)
         # align to step
         if STEP_MAXPOWER > 0:
             rest = (value - MIN_MAXPOWER) % STEP_MAXPOWER
@@ -454,11 +393,6 @@ class DeviceType1MaxPowerNumber(DeviceNumberBase):
         self._update_from_coordinator()
         self.async_write_ha_state()
 
-    async def async_will_remove_from_hass(self) -> None:
-        if self._debounce_task and not self._debounce_task.done():
-            self._debounce_task.cancel()
-        await super().async_will_remove_from_hass()
-
     def _handle_coordinator_update(self) -> None:
         super()._handle_coordinator_update()
 
@@ -468,78 +402,38 @@ class DeviceType1MaxPowerNumber(DeviceNumberBase):
     def native_value(self) -> Optional[float]:
         return float(self._value) if self._value is not None else None
 
-    async def async_set_native_value(self, value: float) -> None:
-        int_val = self._clamp(int(round(value)))
-        self._value = int_val
-        self._pending_value = int_val
-        self._suppress_coordinator_until = (
-            monotonic() + self._DEBOUNCE_SECONDS + self._WRITE_GRACE_SECONDS
-        )
-        self.async_write_ha_state()
+    # ------- writes (batched per device by DeviceSettingsWriteBus) -------
 
-        if self._debounce_task and not self._debounce_task.done():
-            self._debounce_task.cancel()
+    def _find_device_payload(self) -> Optional[Dict[str, Any]]:
+        return self._find_device_from_coordinator()
 
-        async def _send_later() -> None:
-            try:
-                await asyncio.sleep(self._DEBOUNCE_SECONDS)
-                if self._pending_value is None:
-                    return
-
-                dev = self._find_device_from_coordinator()
-                if not dev:
-                    _LOGGER.warning(
-                        "MaxPower: cannot send (id=%s) – device not found in coordinator",
-                        self._device_id,
-                    )
-                    return
-
-                dev_payload = copy.deepcopy(dev)
-
-                # 1) power.maxPower
-                power = dev_payload.setdefault("power", {})
-                power["maxPower"] = int(self._pending_value)
-
-                # 2) settings[*].power.max – keep in sync with actual maxPower
-                settings_list = dev_payload.setdefault("settings", [])
-                if not isinstance(settings_list, list):
-                    settings_list = []
-                    dev_payload["settings"] = settings_list
-
-                if not settings_list:
-                    # fallback: two entries if missing
-                    settings_list.extend([{"power": {}}, {"power": {}}])
-
-                for s in settings_list:
-                    p = s.setdefault("power", {})
-                    p["max"] = int(self._pending_value)
-
-                _LOGGER.debug(
-                    "MaxPower: debounced send maxPower=%s (id=%s)",
-                    self._pending_value,
-                    self._device_id,
-                )
-
-                await self._client.async_post_device_settings(dev_payload)
-                self._suppress_coordinator_until = max(
-                    self._suppress_coordinator_until,
-                    monotonic() + self._WRITE_GRACE_SECONDS,
-                )
-
-            except asyncio.CancelledError:
-                _LOGGER.debug(
-                    "MaxPower: debounced send cancelled (id=%s)",
-                    self._device_id,
-                )
-            except Exception as exc:
-                self._suppress_coordinator_until = 0.0
-                _LOGGER.warning(
-                    "MaxPower: failed to send (id=%s): %s",
-                    self._device_id,
-                    exc,
-                )
-
-        self._debounce_task = self.hass.loop.create_task(_send_later())
+    def _apply_value(self, payload: Dict[str, Any], value: float | int) -> None:
+        """Write power.maxPower and keep settings[*].power.max in sync."""
+        int_val = int(value)
+
+        # 1) power.maxPower
+        power = payload.setdefault("power", {})
+        power["maxPower"] = int_val
+
+        # 2) settings[*].power.max – keep in sync with actual maxPower
+        settings_list = payload.setdefault("settings", [])
+        if not isinstance(settings_list, list):
+            settings_list = []
+            payload["settings"] = settings_list
+
+        if not settings_list:
+            # fallback: two entries if missing
+            settings_list.extend([{"power": {}}, {"power": {}}])
+
+        for s in settings_list:
+            p = s.setdefault("power", {})
+            p["max"] = int_val
+
+        _LOGGER.debug(
+            "MaxPower: debounced send maxPower=%s (id=%s)",
+            int_val,
+            self._device_id,
+        )
 
 
 # End Of File
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
-import asyncio
 import copy
 from time import monotonic
 
@@ -65,7 +64,6 @@ def _has_boost_mode(device: Dict[str, Any]) -> bool:
 
 class DeviceType1BoostModeSelect(DeviceBase, SelectEntity):
     _OPTIMISTIC_WINDOW = 8.0
-    _REFRESH_DELAY = 4.5
 
     def __init__(
         self,
@@ -168,5 +166,4 @@ class DeviceType1BoostModeSelect(DeviceBase, SelectEntity):
         self.async_write_ha_state()
 
         await self._client.async_post_device_settings(payload)
-        await asyncio.sleep(self._REFRESH_DELAY)
-        await self.coordinator.async_request_refresh()
+        self._schedule_refresh()
@@ -437,7 +437,7 @@ class DeviceNumericSensor(DeviceBase, SensorEntity):
         except Exception:
             _LOGGER.exception(
                 "DeviceNumericSensor: failed to parse numeric value for %s (raw=%r, path=%s)",
-                getattr(self, "_attr_unique_id", "?"),
+                self._attr_unique_id,
                 raw,
                 self._raw_path,
             )
@@ -492,7 +492,7 @@ class DeviceMappedSensor(DeviceBase, SensorEntity):
                 _LOGGER.debug(
                     "DeviceMappedSensor: non-integer raw value %r for %s",
                     raw,
-                    getattr(self, "_attr_unique_id", "?"),
+                    self._attr_unique_id,
                 )
                 return None
 
@@ -502,7 +502,7 @@ class DeviceMappedSensor(DeviceBase, SensorEntity):
             _LOGGER.debug(
                 "DeviceMappedSensor: cannot cast %r to int for %s",
                 raw,
-                getattr(self, "_attr_unique_id", "?"),
+                self._attr_unique_id,
             )
             return None
 
@@ -17,7 +17,6 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 import logging
-import asyncio
 from time import monotonic
 import copy
 
@@ -309,7 +308,6 @@ class DeviceType1BlockSolarHeatingSwitch(DeviceBase, SwitchEntity):
     """Switch for settings[*].power.block_solar_heating on device_type_1."""
 
     _OPTIMISTIC_WINDOW = 8.0
-    _REFRESH_DELAY = 4.5
 
     def __init__(
         self,
@@ -405,8 +403,7 @@ class DeviceType1BlockSolarHeatingSwitch(DeviceBase, SwitchEntity):
             path="block_solar_heating",
             value=1,
         )
-        await asyncio.sleep(self._REFRESH_DELAY)
-        await self.coordinator.async_request_refresh()
+        self._schedule_refresh()
 
     async def async_turn_off(self, **kwargs) -> None:
         self._optimistic_state = False
@@ -417,8 +414,7 @@ class DeviceType1BlockSolarHeatingSwitch(DeviceBase, SwitchEntity):
             path="block_solar_heating",
             value=0,
         )
-        await asyncio.sleep(self._REFRESH_DELAY)
-        await self.coordinator.async_request_refresh()
+        self._schedule_refresh()
 
 
 class DeviceType1PowerSettingSwitch(DeviceSwitchBase):
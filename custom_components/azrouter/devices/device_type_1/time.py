@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 from datetime import time
-import asyncio
 import copy
 import logging
 from time import monotonic
@@ -124,7 +123,6 @@ def _has_boost_window_time(device: Dict[str, Any], index: int, key: str) -> bool
 
 class DeviceType1AllowedSolarHeatingTimeBase(DeviceBase, TimeEntity):
     _OPTIMISTIC_WINDOW = 8.0
-    _REFRESH_DELAY = 4.5
     _setting_key: str = ""
 
     def __init__(
@@ -268,8 +266,7 @@ class DeviceType1AllowedSolarHeatingTimeBase(DeviceBase, TimeEntity):
             allowed[self._setting_key] = int(minutes)
 
         await self._client.async_post_device_settings(payload)
-        await asyncio.sleep(self._REFRESH_DELAY)
-        await self.coordinator.async_request_refresh()
+        self._schedule_refresh()
 
 
 class DeviceType1AllowedSolarHeatingStartTime(DeviceType1AllowedSolarHeatingTimeBase):
@@ -282,7 +279,6 @@ class DeviceType1AllowedSolarHeatingStopTime(DeviceType1AllowedSolarHeatingTimeB
 
 class DeviceType1BoostWindowTimeBase(DeviceBase, TimeEntity):
     _OPTIMISTIC_WINDOW = 8.0
-    _REFRESH_DELAY = 4.5
     _setting_key: str = ""
 
     def __init__(
@@ -430,8 +426,7 @@ class DeviceType1BoostWindowTimeBase(DeviceBase, TimeEntity):
             window[self._setting_key] = int(minutes)
 
         await self._client.async_post_device_settings(payload)
-        await asyncio.sleep(self._REFRESH_DELAY)
-        await self.coordinator.async_request_refresh()
+        self._schedule_refresh()
 
 
 class DeviceType1BoostWindowStartTime(DeviceType1BoostWindowTimeBase):
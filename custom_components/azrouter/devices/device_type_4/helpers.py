@@ -139,16 +139,24 @@ def get_primary_charge_settings(device: Dict[str, Any]) -> Dict[str, Any]:
     return charge if isinstance(charge, dict) else {}
 
 
+def _mode_id(mode: Dict[str, Any]) -> int | None:
+    mode_id = mode.get("id")
+    if type(mode_id) is int:
+        return mode_id
+    try:
+        return int(mode_id)
+    except (TypeError, ValueError):
+        return None
+
+
 def get_mode_entry(charge_settings: Dict[str, Any], mode_id: int) -> Dict[str, Any] | None:
     modes = charge_settings.get("mode") or []
     if not isinstance(modes, list):
         return None
+    mode_id = int(mode_id)
     for mode in modes:
-        try:
-            if int(mode.get("id", -1)) == int(mode_id):
-                return mode
-        except Exception:
-            continue
+        if isinstance(mode, dict) and _mode_id(mode) == mode_id:
+            return mode
     return None
 
 
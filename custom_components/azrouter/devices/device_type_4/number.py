@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
-import copy
 import logging
 
 from homeassistant.components.number import NumberEntity, NumberMode
@@ -213,6 +212,7 @@ def create_device_type_4_numbers(
 class DeviceType4ModeNumber(DeviceNumberBase):
     _attr_mode = NumberMode.BOX
     _attr_entity_category = EntityCategory.CONFIG
+    _BATCHED_WRITES = True
 
     def __init__(
         self,
@@ -313,20 +313,19 @@ class DeviceType4ModeNumber(DeviceNumberBase):
             and not self._is_blocked_by_block_solar(dev)
         )
 
-    async def _async_send_value(self, value: float | int) -> None:
-        dev = self._find_device()
-        if not dev:
-            return
-        if self._is_blocked_by_block_charging(dev):
+    def _find_device_payload(self) -> Optional[Dict[str, Any]]:
+        return self._find_device()
+
+    def _apply_value(self, payload: Dict[str, Any], value: float | int) -> None:
+        if self._is_blocked_by_block_charging(payload):
             raise HomeAssistantError(
                 "This option is unavailable while Block Charging is enabled."
             )
-        if self._is_blocked_by_block_solar(dev):
+        if self._is_blocked_by_block_solar(payload):
             raise HomeAssistantError(
                 "6.x options are unavailable while Block Solar Charging is enabled."
             )
 
-        payload = copy.deepcopy(dev)
         int_value = self._clamp(value)
         for item in ensure_charge_settings_list(payload):
             charge = item.setdefault("charge", {})
@@ -342,4 +341,3 @@ class DeviceType4ModeNumber(DeviceNumberBase):
             self._setting_key,
             int_value,
         )
-        await self._client.async_post_device_settings(payload)
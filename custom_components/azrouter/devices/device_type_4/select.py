@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
-import asyncio
 from time import monotonic
 
 from homeassistant.components.select import SelectEntity
@@ -58,7 +57,6 @@ def create_device_type_4_select_entities(
 
 class DeviceType4TriggerPhaseSelect(DeviceBase, SelectEntity):
     _OPTIMISTIC_WINDOW = 8.0
-    _REFRESH_DELAY = 4.5
 
     def __init__(
         self,
@@ -152,5 +150,4 @@ class DeviceType4TriggerPhaseSelect(DeviceBase, SelectEntity):
             self._device_id,
             PHASE_OPTIONS.index(option),
         )
-        await asyncio.sleep(self._REFRESH_DELAY)
-        await self.coordinator.async_request_refresh()
+        self._schedule_refresh()
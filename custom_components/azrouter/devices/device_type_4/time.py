@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 from datetime import time
-import asyncio
 import copy
 from time import monotonic
 
@@ -135,7 +134,6 @@ def create_device_type_4_time_entities(
 
 class DeviceType4TimeBase(DeviceBase, TimeEntity):
     _OPTIMISTIC_WINDOW = 8.0
-    _REFRESH_DELAY = 4.5
 
     def __init__(
         self,
@@ -249,8 +247,7 @@ class DeviceType4TimeBase(DeviceBase, TimeEntity):
         self.async_write_ha_state()
 
         await self._write_minutes(minutes)
-        await asyncio.sleep(self._REFRESH_DELAY)
-        await self.coordinator.async_request_refresh()
+        self._schedule_refresh()
 
 
 class DeviceType4AllowedSolarChargingTime(DeviceType4TimeBase):
@@ -334,7 +334,7 @@ class DeviceNumericSensor(DeviceBase, SensorEntity):
         except Exception:
             _LOGGER.exception(
                 "DeviceNumericSensor: failed to parse numeric value for %s (raw=%r, path=%s)",
-                getattr(self, "_attr_unique_id", "?"),
+                self._attr_unique_id,
                 raw,
                 self._raw_path,
             )
@@ -389,7 +389,7 @@ class DeviceMappedSensor(DeviceBase, SensorEntity):
                 _LOGGER.debug(
                     "DeviceMappedSensor: non-integer raw value %r for %s",
                     raw,
-                    getattr(self, "_attr_unique_id", "?"),
+                    self._attr_unique_id,
                 )
                 return None
 
@@ -399,7 +399,7 @@ class DeviceMappedSensor(DeviceBase, SensorEntity):
             _LOGGER.debug(
                 "DeviceMappedSensor: cannot cast %r to int for %s",
                 raw,
-                getattr(self, "_attr_unique_id", "?"),
+                self._attr_unique_id,
             )
             return None
 
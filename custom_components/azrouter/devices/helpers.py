@@ -3,19 +3,26 @@
 # Helper utilities shared across device and master entities.
 #
 # - _dig: nested dictionary navigation using dot-notation
+# - _dig_parts: same for a pre-split path
 # - _get_value: unified lookup into coordinator data (status/power/settings)
+# - parse_bool: tolerant bool parsing of raw values (0/1, "on"/"off", ...)
 # - find_device_by_id: locate device entry in /devices payload by common.id
 # -----------------------------------------------------------
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
 
 def _dig(d: Dict[str, Any], path: str) -> Any:
     """Traverse a nested dict using a dot-separated path."""
+    return _dig_parts(d, path.split("."))
+
+
+def _dig_parts(d: Dict[str, Any], parts: Sequence[str]) -> Any:
+    """Traverse a nested dict using an already split path."""
     cur: Any = d
-    for part in path.split("."):
+    for part in parts:
         if not isinstance(cur, dict) or part not in cur:
             return None
         cur = cur[part]
@@ -24,48 +31,98 @@ def _dig(d: Dict[str, Any], path: str) -> Any:
 
 def _get_value(
     payload: Dict[str, Any],
-    path: str,
+    path: Union[str, Sequence[str]],
     extra_roots: Optional[Iterable[str]] = None,
+    root_cache: Optional[List[Optional[str]]] = None,
 ) -> Any:
     """
     Try to get a value from a coordinator payload.
 
+    `path` is either a dot-separated string or a pre-split tuple of keys
+    (entities with a fixed path split it once at construction).
+
     Search order:
         1) Directly in payload (works for raw /status, /power, /settings payloads).
         2) In well-known sub-roots: "status", "power", "settings".
         3) In any additional roots passed via extra_roots.
 
+    root_cache is an optional single-slot list owned by the caller. The root
+    that produced a value ("" for the payload itself) is remembered there
+    and tried first on the next call; a miss falls back to the full search.
+
     This helper is intended for dict-based master payloads, not for per-device
     structures in /devices responses.
     """
     if not isinstance(payload, dict):
         return None
 
+    parts = path.split(".") if isinstance(path, str) else path
+
+    # 0) root that answered last time
+    if root_cache is not None and root_cache[0] is not None:
+        cached = root_cache[0]
+        root = payload if cached == "" else payload.get(cached)
+        if isinstance(root, dict):
+            value = _dig_parts(root, parts)
+            if value is not None:
+                return value
+
     # 1) direct lookup
-    value = _dig(payload, path)
+    value = _dig_parts(payload, parts)
     if value is not None:
+        if root_cache is not None:
+            root_cache[0] = ""
         return value
 
-    # 2) known roots
-    for root_key in ("status", "power", "settings"):
+    # 2) known roots, 3) optional extra roots (for future extensions)
+    root_keys: Iterable[str] = ("status", "power", "settings")
+    if extra_roots:
+        root_keys = (*root_keys, *extra_roots)
+
+    for root_key in root_keys:
         root = payload.get(root_key)
         if isinstance(root, dict):
-            value = _dig(root, path)
+            value = _dig_parts(root, parts)
             if value is not None:
+                if root_cache is not None:
+                    root_cache[0] = root_key
                 return value
 
-    # 3) optional extra roots (for future extensions)
-    if extra_roots:
-        for root_key in extra_roots:
-            root = payload.get(root_key)
-            if isinstance(root, dict):
-                value = _dig(root, path)
-                if value is not None:
-                    return value
-
     return None
 
 
+# String states accepted by parse_bool
+_TRUTHY = frozenset({"on", "true", "yes", "1", "1.0"})
+_FALSY = frozenset({"off", "false", "no", "0", "0.0"})
+
+
+def parse_bool(value: Any) -> Optional[bool]:
+    """Try to convert a raw API value to bool, return None if unknown."""
+    t = type(value)
+    if t is bool:
+        return value
+    if t is int:
+        return value != 0
+    if t is float:
+        # truncate like int(): 0.5 -> False; nan/inf are unknown
+        try:
+            return int(value) != 0
+        except (ValueError, OverflowError):
+            return None
+    if value is None:
+        return None
+
+    s = str(value).strip().lower()
+    if s in _TRUTHY:
+        return True
+    if s in _FALSY:
+        return False
+    try:
+        return int(s) != 0
+    except ValueError:
+        return None
+
+
 def find_device_by_id(devices: List[Dict[str, Any]], device_id: int) -> Optional[Dict[str, Any]]:
     """
     Find a device entry in /devices payload by its common.id.
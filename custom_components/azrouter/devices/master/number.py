@@ -119,30 +119,31 @@ class AzRouterMasterTargetPowerNumber(MasterBase, NumberEntity):
         if self._debounce_task and not self._debounce_task.done():
             self._debounce_task.cancel()
 
-        async def _send_later() -> None:
-            try:
-                await asyncio.sleep(self._DEBOUNCE_SECONDS)
-                if self._pending_value is None:
-                    return
-                _LOGGER.debug(
-                    "Debounced send Master target_power_w = %s",
-                    self._pending_value,
-                )
-                await self._client.async_set_master_target_power(self._pending_value)
-                self._suppress_coordinator_until = max(
-                    self._suppress_coordinator_until,
-                    monotonic() + self._WRITE_GRACE_SECONDS,
-                )
-            except asyncio.CancelledError:
-                _LOGGER.debug("Debounced send cancelled")
-            except Exception as exc:
-                self._suppress_coordinator_until = 0.0
-                _LOGGER.warning(
-                    "Failed to send Master target_power_w: %s", exc
-                )
-
         # naplánujeme nový POST do budoucna
-        self._debounce_task = self.hass.loop.create_task(_send_later())
+        self._debounce_task = self.hass.async_create_task(self._debounced_send())
+
+    async def _debounced_send(self) -> None:
+        """Po uplynutí debounce pošle poslední pending hodnotu."""
+        try:
+            await asyncio.sleep(self._DEBOUNCE_SECONDS)
+            if self._pending_value is None:
+                return
+            _LOGGER.debug(
+                "Debounced send Master target_power_w = %s",
+                self._pending_value,
+            )
+            await self._client.async_set_master_target_power(self._pending_value)
+            self._suppress_coordinator_until = max(
+                self._suppress_coordinator_until,
+                monotonic() + self._WRITE_GRACE_SECONDS,
+            )
+        except asyncio.CancelledError:
+            _LOGGER.debug("Debounced send cancelled")
+        except Exception as exc:
+            self._suppress_coordinator_until = 0.0
+            _LOGGER.warning(
+                "Failed to send Master target_power_w: %s", exc
+            )
 
     # --- NOVÉ: čtení ze coordinator.data["settings"] ---
 
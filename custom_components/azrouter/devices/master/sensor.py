@@ -11,9 +11,10 @@
 from __future__ import annotations
 
 from typing import List, Optional
-from datetime import datetime, timezone
+from datetime import datetime
+import asyncio
 import logging
-import re
+import time
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -31,6 +32,7 @@ from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.util import dt as hass_dt
 
+from ..helpers import parse_bool
 from ..sensor import MasterBase
 
 _LOGGER = logging.getLogger(__name__)
@@ -39,25 +41,264 @@ _LOGGER = logging.getLogger(__name__)
 # Human-friendly string maps
 # ---------------------------------------------------------------------------
 
-MODE_STRINGS = ["Summer", "Winter"]
-SYSTEM_STATUS_STRINGS = ["Online", "Offline", "Updating"]
-HDO_STRINGS = ["Off", "On"]
-CLOUD_STRINGS = ["No", "Yes"]
-GRID_STRINGS = ["Connected", "Disconnected"]
+MODE_STRINGS = ("Summer", "Winter")
+SYSTEM_STATUS_STRINGS = ("Online", "Offline", "Updating")
+HDO_STRINGS = ("Off", "On")
+CLOUD_STRINGS = ("No", "Yes")
+GRID_STRINGS = ("Connected", "Disconnected")
+
+# Yield to the event loop after this many master_data items during setup
+_SETUP_YIELD_EVERY = 32
 
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _get_master_value(master_data: list[dict], raw_path: str):
-    """Return value from master_data for the given path, or None."""
-    for item in master_data:
+def _get_master_value(data: dict, raw_path: str):
+    """Return value for the given master path, or None.
+
+    Uses the path -> value index built by the client on each refresh and
+    falls back to scanning master_data when the index is missing.
+    """
+    index = data.get("master_index")
+    if isinstance(index, dict):
+        return index.get(raw_path)
+
+    for item in data.get("master_data", []):
         if item.get("path") == raw_path:
             return item.get("value")
     return None
 
 
+# Timestamp parsing: epoch values above this are milliseconds
+_TS_MS_THRESHOLD = 10**12
+# Accepted epoch range in seconds (2000-01-01 .. 2100-01-01)
+_TS_MIN = 946684800
+_TS_MAX = 4102444800
+# Local-epoch detection is only attempted within this distance of now (s)
+_LOCAL_EPOCH_WINDOW = 2 * 86400
+
+# Local UTC offset in seconds, cached per HA time zone until the next UTC
+# quarter hour. Zone offsets and DST switches fall on quarter hours in UTC
+# (e.g. half-hour zones like America/St_Johns), so the value never goes stale.
+_OFFSET_CACHE_PERIOD = 900
+_UTC_OFFSET_CACHE = {"expires": 0.0, "offset": 0, "tz": None}
+
+
+def _local_utc_offset(now_wall: float) -> int:
+    """Return the cached local UTC offset in seconds."""
+    tz = hass_dt.DEFAULT_TIME_ZONE
+    if now_wall >= _UTC_OFFSET_CACHE["expires"] or tz is not _UTC_OFFSET_CACHE["tz"]:
+        utco = hass_dt.now().utcoffset()
+        _UTC_OFFSET_CACHE["offset"] = int(utco.total_seconds()) if utco else 0
+        _UTC_OFFSET_CACHE["expires"] = (
+            now_wall - (now_wall % _OFFSET_CACHE_PERIOD) + _OFFSET_CACHE_PERIOD
+        )
+        _UTC_OFFSET_CACHE["tz"] = tz
+    return _UTC_OFFSET_CACHE["offset"]
+
+
+def _mk(cls, coordinator, entry: ConfigEntry, raw_path: str, key: str, name: str, **kwargs):
+    """Construct one master entity; the shared arguments are passed positionally."""
+    return cls(
+        coordinator=coordinator,
+        entry=entry,
+        key=key,
+        name=name,
+        raw_path=raw_path,
+        **kwargs,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Builders for numbered power paths: power.<kind>.<idx>.value
+#
+# Each builder returns the entities for one path, or None when the path is
+# not handled and should fall through to the single-path match below.
+# ---------------------------------------------------------------------------
+
+def _build_input_voltage(coordinator, entry: ConfigEntry, path: str, idx: int):
+    if idx > 2:
+        return []
+    return [
+        _mk(
+            AzRouterScalarSensor, coordinator, entry, path,
+            f"input_voltage_{idx}", f"Grid Voltage L{idx+1}",
+            unit=UnitOfElectricPotential.VOLT,
+            devclass=SensorDeviceClass.VOLTAGE,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        )
+    ]
+
+
+def _build_input_current(coordinator, entry: ConfigEntry, path: str, idx: int):
+    if idx > 2:
+        return []
+    return [
+        _mk(
+            AzRouterScalarSensor, coordinator, entry, path,
+            f"input_current_{idx}", f"Grid Current L{idx+1}",
+            unit=UnitOfElectricCurrent.AMPERE,
+            devclass=SensorDeviceClass.CURRENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        )
+    ]
+
+
+def _build_input_power(coordinator, entry: ConfigEntry, path: str, idx: int):
+    if idx > 2:
+        return []
+    created = [
+        _mk(
+            AzRouterScalarSensor, coordinator, entry, path,
+            f"input_power_{idx}", f"Grid Power L{idx+1}",
+            unit=UnitOfPower.WATT,
+            devclass=SensorDeviceClass.POWER,
+        )
+    ]
+
+    # When we see L3 (idx == 2) also create a total power sensor.
+    if idx == 2:
+        created.append(
+            _mk(
+                AzRouterScalarSensor, coordinator, entry,
+                "power.input.power.total",  # special raw_path handled by the class
+                "input_power_total", "Grid Power Total",
+                unit=UnitOfPower.WATT,
+                devclass=SensorDeviceClass.POWER,
+            )
+        )
+    return created
+
+
+def _build_input_status(coordinator, entry: ConfigEntry, path: str, idx: int):
+    if idx > 2:
+        return []
+    return [
+        _mk(
+            AzRouterScalarSensor, coordinator, entry, path,
+            f"input_status_{idx}", f"Grid Status L{idx+1}",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        )
+    ]
+
+
+def _build_output_power(coordinator, entry: ConfigEntry, path: str, idx: int):
+    if idx < 3:
+        return [
+            _mk(
+                AzRouterScalarSensor, coordinator, entry, path,
+                f"output_power_{idx}", f"Routed Power L{idx+1}",
+                unit=UnitOfPower.WATT,
+                devclass=SensorDeviceClass.POWER,
+            )
+        ]
+
+    # idx == 3 -> Routed total
+    if idx == 3:
+        return [
+            _mk(
+                AzRouterScalarSensor, coordinator, entry, path,
+                "output_power_total", "Routed Power Total",
+                unit=UnitOfPower.WATT,
+                devclass=SensorDeviceClass.POWER,
+            )
+        ]
+    return None
+
+
+_PHASE_BUILDERS = {
+    "power.input.voltage": _build_input_voltage,
+    "power.input.current": _build_input_current,
+    "power.input.power": _build_input_power,
+    "power.input.status": _build_input_status,
+    "power.output.power": _build_output_power,
+}
+
+
+# ---------------------------------------------------------------------------
+# Builders for single-value master paths
+# ---------------------------------------------------------------------------
+
+def _energy(key: str, name: str):
+    return lambda c, e, p: [
+        _mk(
+            AzRouterScalarSensor, c, e, p, key, name,
+            unit=UnitOfEnergy.KILO_WATT_HOUR,
+            devclass=SensorDeviceClass.ENERGY,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        )
+    ]
+
+
+def _diagnostic(key: str, name: str):
+    return lambda c, e, p: [
+        _mk(AzRouterScalarSensor, c, e, p, key, name, entity_category=EntityCategory.DIAGNOSTIC)
+    ]
+
+
+def _timestamp(key: str, name: str):
+    return lambda c, e, p: [
+        _mk(AzRouterTimestampSensor, c, e, p, key, name, entity_category=EntityCategory.DIAGNOSTIC)
+    ]
+
+
+_SINGLE_PATH_BUILDERS = {
+    "power.output.energy.0.value": _energy("output_energy_0", "Saved Energy Total"),
+    "power.output.energy.1.value": _energy("output_energy_1", "Saved Energy This Year"),
+    "power.output.energy.2.value": _energy("output_energy_2", "Saved Energy This Month"),
+    "power.output.energy.3.value": _energy("output_energy_3", "Saved Energy This Week"),
+    "power.output.energy.4.value": _energy("output_energy_4", "Saved Energy Today"),
+    "power.lastUpdate": _timestamp("last_update_ts", "Last Update"),
+    "status.system.status": lambda c, e, p: [
+        _mk(AzRouterScalarSensor, c, e, p, "system_status", "System Status"),
+        _mk(
+            AzRouterScalarSensor, c, e, p, "system_status_code", "System Status Code",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    ],
+    "status.system.hdo": lambda c, e, p: [
+        _mk(AzRouterBinarySensor, c, e, p, "system_hdo", "HDO"),
+    ],
+    "status.system.mode": lambda c, e, p: [
+        _mk(AzRouterScalarSensor, c, e, p, "mode", "Mode"),
+        _mk(
+            AzRouterScalarSensor, c, e, p, "mode_code", "Mode Code",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    ],
+    "status.system.temperature": lambda c, e, p: [
+        _mk(
+            AzRouterScalarSensor, c, e, p, "system_temperature", "System Temperature",
+            unit=UnitOfTemperature.CELSIUS,
+            devclass=SensorDeviceClass.TEMPERATURE,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        )
+    ],
+    "status.system.time": _timestamp("system_time", "System Time"),
+    "status.system.uptime": _diagnostic("system_uptime", "System Uptime"),
+    "status.system.hw": _diagnostic("hw_version", "HW Version"),
+    "status.system.sn": _diagnostic("serial_number", "Serial Number"),
+    "status.system.mac": _diagnostic("system_mac", "MAC Address"),
+    "status.system.fw": _diagnostic("fw_version", "FW Version"),
+    "status.system.www": _diagnostic("web_ui", "Web UI"),
+    "status.cloud.status": _diagnostic("cloud_status", "Cloud Status"),
+    "status.cloud.reachable": _diagnostic("cloud_reachable", "Cloud Reachable"),
+    "status.cloud.registered": _diagnostic("cloud_registered", "Cloud Registered"),
+}
+
+# Known master paths that intentionally do not become sensors
+_IGNORED_PATHS = frozenset(
+    {
+        "status.system.masterBoost",  # handled by switches
+        "status.activeDevice.id",
+        "status.activeDevice.maxPower",
+        "status.activeDevice.name",
+    }
+)
+
+
 # ---------------------------------------------------------------------------
 # Factory: create master entities
 # ---------------------------------------------------------------------------
@@ -80,7 +321,17 @@ async def async_create_entities(coordinator, entry: ConfigEntry) -> List[SensorE
         _LOGGER.warning("master_data is not a list (%s)", type(master))
         return []
 
-    for item in master:
+    # Hot-loop locals: avoid repeated global/attribute lookups per path
+    extend = entities.extend
+    ignored = _IGNORED_PATHS
+    phase_builder = _PHASE_BUILDERS.get
+    single_builder = _SINGLE_PATH_BUILDERS.get
+
+    for pos, item in enumerate(master, 1):
+        # Large payloads: let other tasks run while entities are being built
+        if pos % _SETUP_YIELD_EVERY == 0:
+            await asyncio.sleep(0)
+
         path = item.get("path")
 
         if not isinstance(path, str):
@@ -90,438 +341,107 @@ async def async_create_entities(coordinator, entry: ConfigEntry) -> List[SensorE
         if path.endswith(".id"):
             continue
 
-        # --- Input voltages: power.input.voltage.<idx>.value ---
-        m = re.match(r"^power\.input\.voltage\.(\d+)\.value$", path)
-        if m:
-            idx = int(m.group(1))
-            if idx > 2:
-                continue
-            entities.append(
-                AzRouterScalarSensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    key=f"input_voltage_{idx}",
-                    name=f"Grid Voltage L{idx+1}",
-                    raw_path=path,
-                    unit=UnitOfElectricPotential.VOLT,
-                    devclass=SensorDeviceClass.VOLTAGE,
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                )
-            )
+        if path in ignored:
             continue
 
-        # --- Input currents: power.input.current.<idx>.value ---
-        m = re.match(r"^power\.input\.current\.(\d+)\.value$", path)
-        if m:
-            idx = int(m.group(1))
-            if idx > 2:
-                continue
-            entities.append(
-                AzRouterScalarSensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    key=f"input_current_{idx}",
-                    name=f"Grid Current L{idx+1}",
-                    raw_path=path,
-                    unit=UnitOfElectricCurrent.AMPERE,
-                    devclass=SensorDeviceClass.CURRENT,
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                )
-            )
+        # --- Numbered power paths: power.<kind>.<idx>.value ---
+        if path.startswith("power.") and path.endswith(".value"):
+            prefix, _, idx_str = path[:-6].rpartition(".")
+            builder = phase_builder(prefix)
+            if builder is not None and idx_str.isdigit():
+                created = builder(coordinator, entry, path, int(idx_str))
+                if created is not None:
+                    extend(created)
+                    continue
+
+        # --- Remaining single-value paths ---
+        builder = single_builder(path)
+        if builder is not None:
+            extend(builder(coordinator, entry, path))
             continue
 
-        # --- Input power per phase: power.input.power.<idx>.value ---
-        m = re.match(r"^power\.input\.power\.(\d+)\.value$", path)
-        if m:
-            idx = int(m.group(1))
-            if idx > 2:
-                continue
-
-            entities.append(
-                AzRouterScalarSensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    key=f"input_power_{idx}",
-                    name=f"Grid Power L{idx+1}",
-                    raw_path=path,
-                    unit=UnitOfPower.WATT,
-                    devclass=SensorDeviceClass.POWER,
-                )
-            )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Unhandled master path %s = %s", path, item.get("value"))
 
-            # When we see L3 (idx == 2) also create a total power sensor.
-            if idx == 2:
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="input_power_total",
-                        name="Grid Power Total",
-                        raw_path="power.input.power.total",  # special raw_path handled by the class
-                        unit=UnitOfPower.WATT,
-                        devclass=SensorDeviceClass.POWER,
-                    )
-                )
-            continue
+    return entities
 
-        # --- Input status (connected/disconnected) per phase ---
-        m = re.match(r"^power\.input\.status\.(\d+)\.value$", path)
-        if m:
-            idx = int(m.group(1))
-            if idx > 2:
-                continue
-            entities.append(
-                AzRouterScalarSensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    key=f"input_status_{idx}",
-                    name=f"Grid Status L{idx+1}",
-                    raw_path=path,
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                )
-            )
-            continue
 
-        # --- Output power per phase: power.output.power.<idx>.value ---
-        m = re.match(r"^power\.output\.power\.(\d+)\.value$", path)
-        if m:
-            idx = int(m.group(1))
-            if idx < 3:
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key=f"output_power_{idx}",
-                        name=f"Routed Power L{idx+1}",
-                        raw_path=path,
-                        unit=UnitOfPower.WATT,
-                        devclass=SensorDeviceClass.POWER,
-                    )
-                )
-                continue
-
-            # idx == 3 -> Routed total
-            if idx == 3:
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="output_power_total",
-                        name="Routed Power Total",
-                        raw_path=path,
-                        unit=UnitOfPower.WATT,
-                        devclass=SensorDeviceClass.POWER,
-                    )
-                )
-                continue
-
-        # --- Remaining single-value paths handled by match/case ---
-        match path:
-            case "power.output.energy.0.value":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="output_energy_0",
-                        name="Saved Energy Total",
-                        raw_path=path,
-                        unit=UnitOfEnergy.KILO_WATT_HOUR,
-                        devclass=SensorDeviceClass.ENERGY,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "power.output.energy.1.value":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="output_energy_1",
-                        name="Saved Energy This Year",
-                        raw_path=path,
-                        unit=UnitOfEnergy.KILO_WATT_HOUR,
-                        devclass=SensorDeviceClass.ENERGY,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "power.output.energy.2.value":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="output_energy_2",
-                        name="Saved Energy This Month",
-                        raw_path=path,
-                        unit=UnitOfEnergy.KILO_WATT_HOUR,
-                        devclass=SensorDeviceClass.ENERGY,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "power.output.energy.3.value":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="output_energy_3",
-                        name="Saved Energy This Week",
-                        raw_path=path,
-                        unit=UnitOfEnergy.KILO_WATT_HOUR,
-                        devclass=SensorDeviceClass.ENERGY,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "power.output.energy.4.value":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="output_energy_4",
-                        name="Saved Energy Today",
-                        raw_path=path,
-                        unit=UnitOfEnergy.KILO_WATT_HOUR,
-                        devclass=SensorDeviceClass.ENERGY,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "power.lastUpdate":
-                entities.append(
-                    AzRouterTimestampSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="last_update_ts",
-                        name="Last Update",
-                        raw_path=path,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "status.system.status":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="system_status",
-                        name="System Status",
-                        raw_path=path,
-                    )
-                )
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="system_status_code",
-                        name="System Status Code",
-                        raw_path=path,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "status.system.hdo":
-                entities.append(
-                    AzRouterBinarySensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="system_hdo",
-                        name="HDO",
-                        raw_path=path,
-                    )
-                )
-                continue
-
-            case "status.system.mode":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="mode",
-                        name="Mode",
-                        raw_path=path,
-                    )
-                )
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="mode_code",
-                        name="Mode Code",
-                        raw_path=path,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "status.system.temperature":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="system_temperature",
-                        name="System Temperature",
-                        raw_path=path,
-                        unit=UnitOfTemperature.CELSIUS,
-                        devclass=SensorDeviceClass.TEMPERATURE,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "status.system.time":
-                entities.append(
-                    AzRouterTimestampSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="system_time",
-                        name="System Time",
-                        raw_path=path,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "status.system.masterBoost":
-                # handled by switches, no sensor
-                continue
-
-            case "status.system.uptime":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="system_uptime",
-                        name="System Uptime",
-                        raw_path=path,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "status.system.hw":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="hw_version",
-                        name="HW Version",
-                        raw_path=path,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "status.system.sn":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="serial_number",
-                        name="Serial Number",
-                        raw_path=path,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "status.system.mac":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="system_mac",
-                        name="MAC Address",
-                        raw_path=path,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "status.system.fw":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="fw_version",
-                        name="FW Version",
-                        raw_path=path,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "status.system.www":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="web_ui",
-                        name="Web UI",
-                        raw_path=path,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "status.cloud.status":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="cloud_status",
-                        name="Cloud Status",
-                        raw_path=path,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "status.cloud.reachable":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="cloud_reachable",
-                        name="Cloud Reachable",
-                        raw_path=path,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
-
-            case "status.cloud.registered":
-                entities.append(
-                    AzRouterScalarSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        key="cloud_registered",
-                        name="Cloud Registered",
-                        raw_path=path,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    )
-                )
-                continue
+# ---------------------------------------------------------------------------
+# Value transformations for AzRouterScalarSensor, selected once per key
+# ---------------------------------------------------------------------------
 
-            case "status.activeDevice.id":
-                continue
-            case "status.activeDevice.maxPower":
-                continue
-            case "status.activeDevice.name":
-                continue
+_MAC_SEPARATORS = str.maketrans("", "", "-:")
 
-            case _:
-                _LOGGER.debug("Unhandled master path %s = %s", path, item.get("value"))
-                continue
 
-    return entities
+def _scale_milli(val):
+    """mV/mA -> V/A."""
+    return round(val / 1000.0, 3)
+
+
+def _grid_status(val):
+    try:
+        return GRID_STRINGS[int(val)]
+    except (IndexError, TypeError, ValueError):
+        return val
+
+
+def _code_mapper(strings):
+    def _map(val):
+        if isinstance(val, int) and val >= 0:
+            try:
+                return strings[val]
+            except IndexError:
+                pass
+        return val
+
+    return _map
+
+
+def _format_mac(val):
+    raw = str(val)
+    mac = raw.translate(_MAC_SEPARATORS).strip()
+    # fromhex() skips whitespace, so reject it explicitly via isalnum()
+    if len(mac) != 12 or not mac.isalnum():
+        return raw
+    try:
+        bytes.fromhex(mac)
+    except ValueError:
+        return raw
+    mac = mac.upper()
+    return f"{mac[0:2]}:{mac[2:4]}:{mac[4:6]}:{mac[6:8]}:{mac[8:10]}:{mac[10:12]}"
+
+
+def _format_uptime(val):
+    try:
+        seconds = int(val)
+        # In case value is in milliseconds
+        if seconds > 10**6:
+            seconds = int(seconds / 1000)
+        days, rem = divmod(int(seconds), 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes, sec = divmod(rem, 60)
+        return f"{days} days {hours:02d}:{minutes:02d}:{sec:02d}"
+    except Exception:
+        return val
+
+
+_KEY_TRANSFORMS = {
+    "system_status": _code_mapper(SYSTEM_STATUS_STRINGS),
+    "mode": _code_mapper(MODE_STRINGS),
+    "cloud_reachable": _code_mapper(CLOUD_STRINGS),
+    "cloud_registered": _code_mapper(CLOUD_STRINGS),
+    "system_mac": _format_mac,
+    "system_uptime": _format_uptime,
+}
+
+
+def _transform_for_key(key: str):
+    """Return the value transformation for a sensor key, or None."""
+    if key.startswith(("input_voltage_", "input_current_")):
+        return _scale_milli
+    if key.startswith("input_status_"):
+        return _grid_status
+    return _KEY_TRANSFORMS.get(key)
 
 
 # ---------------------------------------------------------------------------
@@ -565,6 +485,11 @@ class AzRouterScalarSensor(MasterBase, SensorEntity):
 
         self._raw_path = raw_path
         self._key = key
+        self._transform = _transform_for_key(key)
+
+        # native_value memo, valid while coordinator.data is the same object
+        self._cached_data = None
+        self._cached_value = None
 
         # UI details – icons
         if self._key.startswith("cloud_"):
@@ -575,18 +500,34 @@ class AzRouterScalarSensor(MasterBase, SensorEntity):
     @property
     def native_value(self):
         """
-        Read value from master_data and apply key-specific transformations:
+        Read value from master_data and apply the key-specific transformation
+        selected in __init__:
 
           - scale voltages/currents (mV/mA → V/A),
           - map status codes to strings,
           - format MAC address,
           - convert uptime seconds to human-readable string.
+
+        The result is reused until the coordinator publishes new data.
         """
-        data = self.coordinator.data or {}
+        data = self.coordinator.data
+        if data is not None and data is self._cached_data:
+            return self._cached_value
+
+        value = self._compute_value(data or {})
+        self._cached_data = data
+        self._cached_value = value
+        return value
+
+    def _compute_value(self, data: dict):
         master = data.get("master_data", [])
 
         # Special case: aggregated input power from all phases
         if self._raw_path == "power.input.power.total":
+            total = data.get("input_power_total")
+            if total is not None:
+                return total
+
             total = 0
             for item in master:
                 p = item.get("path")
@@ -599,57 +540,13 @@ class AzRouterScalarSensor(MasterBase, SensorEntity):
                         continue
             return total
 
-        val = _get_master_value(master, self._raw_path)
+        val = _get_master_value(data, self._raw_path)
         if val is None:
             return None
 
-        # transformations/mappings
-        if self._key.startswith("input_voltage_"):
-            val = round(val / 1000.0, 3)
-        if self._key.startswith("input_current_"):
-            val = round(val / 1000.0, 3)
-        if self._key.startswith("input_status_"):
-            try:
-                val = GRID_STRINGS[int(val)]
-            except Exception:
-                pass
-
-        if self._key == "system_status":
-            if isinstance(val, int) and 0 <= val < len(SYSTEM_STATUS_STRINGS):
-                val = SYSTEM_STATUS_STRINGS[val]
-
-        if self._key == "mode":
-            if isinstance(val, int) and 0 <= val < len(MODE_STRINGS):
-                val = MODE_STRINGS[val]
-
-        if self._key in ("cloud_reachable", "cloud_registered"):
-            if isinstance(val, int) and 0 <= val < len(CLOUD_STRINGS):
-                val = CLOUD_STRINGS[val]
-
-        if self._key == "system_mac":
-            try:
-                mac = str(val).replace("-", "").replace(":", "").strip()
-                if len(mac) == 12 and all(c in "0123456789ABCDEFabcdef" for c in mac):
-                    mac = mac.upper()
-                    return ":".join(mac[i:i + 2] for i in range(0, 12, 2))
-                return str(val)
-            except Exception:
-                return str(val)
-
-        if self._key == "system_uptime":
-            try:
-                seconds = int(val)
-                # In case value is in milliseconds
-                if seconds > 10**6:
-                    seconds = int(seconds / 1000)
-                days, rem = divmod(int(seconds), 86400)
-                hours, rem = divmod(rem, 3600)
-                minutes, sec = divmod(rem, 60)
-                return f"{days} days {hours:02d}:{minutes:02d}:{sec:02d}"
-            except Exception:
-                return val
-
-        return val
+        if self._transform is None:
+            return val
+        return self._transform(val)
 
 
 class AzRouterBinarySensor(MasterBase, BinarySensorEntity):
@@ -689,24 +586,12 @@ class AzRouterBinarySensor(MasterBase, BinarySensorEntity):
     def is_on(self) -> Optional[bool]:
         """Return boolean state based on the value in master_data."""
         data = self.coordinator.data or {}
-        master = data.get("master_data", [])
 
-        val = _get_master_value(master, self._raw_path)
+        val = _get_master_value(data, self._raw_path)
         if val is None:
             return None
 
-        try:
-            if isinstance(val, bool):
-                return bool(val)
-            ival = int(val)
-            return ival != 0
-        except Exception:
-            s = str(val).lower()
-            if s in ("on", "true", "yes"):
-                return True
-            if s in ("off", "false", "no"):
-                return False
-        return None
+        return parse_bool(val)
 
 
 class AzRouterTimestampSensor(MasterBase, SensorEntity):
@@ -751,12 +636,23 @@ class AzRouterTimestampSensor(MasterBase, SensorEntity):
         if self._raw_path in ("status.system.time", "power.lastUpdate"):
             self._attr_icon = "mdi:clock"
 
+        # native_value memo, valid while coordinator.data is the same object
+        self._cached_data = None
+        self._cached_value = None
+
     @property
     def native_value(self):
-        data = self.coordinator.data or {}
-        master = data.get("master_data", [])
+        data = self.coordinator.data
+        if data is not None and data is self._cached_data:
+            return self._cached_value
+
+        value = self._compute_value(data or {})
+        self._cached_data = data
+        self._cached_value = value
+        return value
 
-        raw = _get_master_value(master, self._raw_path)
+    def _compute_value(self, data: dict):
+        raw = _get_master_value(data, self._raw_path)
         if raw is None:
             return None
 
@@ -780,31 +676,36 @@ class AzRouterTimestampSensor(MasterBase, SensorEntity):
             return None
 
         # Detect milliseconds vs seconds
-        if ts > 10**12:
-            ts = int(ts / 1000)
-
-        # Detect local epoch vs UTC epoch
-        try:
-            now_utc_ts = int(datetime.now(timezone.utc).timestamp())
-            utco = hass_dt.now().utcoffset() or 0
-            offset_sec = int(utco.total_seconds()) if hasattr(utco, "total_seconds") else int(utco)
-            if abs((ts - now_utc_ts) - offset_sec) <= 120:
-                ts = int(ts - offset_sec)
-        except Exception as exc:
-            _LOGGER.debug(
-                "TimestampSensor %s: error while detecting local epoch: %s",
-                self._attr_name,
-                exc,
-            )
+        if ts > _TS_MS_THRESHOLD:
+            ts //= 1000
+
+        # Detect local epoch vs UTC epoch; only values near "now" can be
+        # shifted by a UTC offset, anything further away is left alone.
+        now_wall = time.time()
+        delta = ts - int(now_wall)
+        if -_LOCAL_EPOCH_WINDOW < delta < _LOCAL_EPOCH_WINDOW:
+            try:
+                offset_sec = _local_utc_offset(now_wall)
+                if abs(delta - offset_sec) <= 120:
+                    ts -= offset_sec
+            except Exception as exc:
+                _LOGGER.debug(
+                    "TimestampSensor %s: error while detecting local epoch: %s",
+                    self._attr_name,
+                    exc,
+                )
 
         # Sanity check (between year 2000 and 2100)
-        if ts < 946684800 or ts > 4102444800:
+        if not _TS_MIN <= ts <= _TS_MAX:
             return None
 
         try:
-            dt_utc = datetime.fromtimestamp(ts, tz=timezone.utc)
-            dt_local = hass_dt.as_local(dt_utc)
-            return dt_local.strftime("%Y-%m-%d %H:%M:%S")
+            # Same result as as_local(), without the intermediate UTC datetime
+            dt_local = datetime.fromtimestamp(ts, tz=hass_dt.DEFAULT_TIME_ZONE)
+            return (
+                f"{dt_local.year:04d}-{dt_local.month:02d}-{dt_local.day:02d} "
+                f"{dt_local.hour:02d}:{dt_local.minute:02d}:{dt_local.second:02d}"
+            )
         except Exception as err:
             _LOGGER.exception(
                 "TimestampSensor %s: error converting timestamp: %s",
@@ -29,7 +29,11 @@ async def async_create_entities(
     entry: ConfigEntry,
     client: AzRouterClient,
 ) -> List[SwitchEntity]:
-    """Create master switch entities (currently only Master Boost)."""
+    """Create master switch entities (currently only Master Boost).
+
+    Entities render from the current coordinator.data, so they are added
+    without an extra update before add.
+    """
 
     entities: List[SwitchEntity] = []
 
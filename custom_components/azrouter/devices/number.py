@@ -17,23 +17,297 @@
 #           -> optional: clamp / snap value to valid range (min/max/step)
 #       _async_send_value(self, value: float | int) -> Awaitable[None]
 #           -> actually send the value to the device via API client
+#   - or, for numbers that edit the device settings payload, set
+#     _BATCHED_WRITES = True and implement _find_device_payload() and
+#     _apply_value(payload, value); writes for the same device are then
+#     merged by DeviceSettingsWriteBus into one POST.
+#
+# ServiceWriteCoalescer:
+#   - merges rapid repeated number service calls per device (see ../number.py)
 # -----------------------------------------------------------
 
 from __future__ import annotations
 
-from typing import Optional, Any
+from typing import Optional, Any, Awaitable, Callable, Dict, Set, Tuple
 import asyncio
+import copy
 import logging
 from time import monotonic
 
 from homeassistant.components.number import NumberEntity
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from ..api import AzRouterClient
 from .sensor import DeviceBase
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class DeviceSettingsWriteBus:
+    """
+    Coalesces debounced number writes per device into one settings POST.
+
+    Sibling numbers of one device (e.g. target + boost temperature) each
+    edit the full device payload. Sent separately, the second POST is built
+    from coordinator data that does not contain the first change yet and
+    reverts it. The bus collects the pending values of all numbers of a
+    device, waits until no new value arrived for the debounce delay, then
+    applies them to a single copy of the device payload and posts it once.
+    """
+
+    def __init__(self, hass: HomeAssistant, client: AzRouterClient) -> None:
+        self._hass = hass
+        self._client = client
+        # (deviceType, device_id) -> {unique_id: (entity, value)}
+        self._pending: Dict[Tuple[str, Any], Dict[str, Tuple["DeviceNumberBase", float]]] = {}
+        # flush timer per device, re-armed by every new value
+        self._timers: Dict[Tuple[str, Any], asyncio.TimerHandle] = {}
+        # POSTs in flight, cancelled on unload
+        self._flushing: Set[asyncio.Task] = set()
+
+    def submit(self, entity: "DeviceNumberBase", value: float, delay: float) -> None:
+        """Queue a value for the entity's device and (re)arm the flush timer."""
+        key = (entity._device_type, entity._device_id)
+        self._pending.setdefault(key, {})[entity.unique_id] = (entity, value)
+
+        handle = self._timers.get(key)
+        if handle is not None:
+            handle.cancel()
+        self._timers[key] = self._hass.loop.call_later(delay, self._flush_due, key)
+
+    def withdraw(self, entity: "DeviceNumberBase") -> None:
+        """Drop the entity's pending value (entity is being removed)."""
+        key = (entity._device_type, entity._device_id)
+        batch = self._pending.get(key)
+        if batch is None or batch.pop(entity.unique_id, None) is None or batch:
+            return
+        # last pending value of the device: nothing left to flush
+        del self._pending[key]
+        handle = self._timers.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+    def cancel(self) -> None:
+        """Drop all pending writes (used on config entry unload)."""
+        for handle in self._timers.values():
+            handle.cancel()
+        for task in self._flushing:
+            task.cancel()
+        self._timers.clear()
+        self._flushing.clear()
+        self._pending.clear()
+
+    @callback
+    def _flush_due(self, key: Tuple[str, Any]) -> None:
+        """Flush timer fired: post the batch collected for the device."""
+        self._timers.pop(key, None)
+        # Detach the batch before posting so new values start a new flush.
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        task = self._hass.async_create_task(self._async_flush(key, batch))
+        self._flushing.add(task)
+        task.add_done_callback(self._flushing.discard)
+
+    async def _async_flush(
+        self,
+        key: Tuple[str, Any],
+        batch: Dict[str, Tuple["DeviceNumberBase", float]],
+    ) -> None:
+        entries = list(batch.values())
+        dev = entries[0][0]._find_device_payload()
+        if not dev:
+            err = RuntimeError("device not found in coordinator data")
+            for entity, _value in entries:
+                entity._write_failed(err)
+            return
+
+        payload = copy.deepcopy(dev)
+        applied = []
+        for entity, value in entries:
+            try:
+                entity._apply_value(payload, value)
+            except Exception as exc:  # noqa: BLE001
+                entity._write_failed(exc)
+                continue
+            applied.append(entity)
+
+        if not applied:
+            return
+
+        _LOGGER.debug(
+            "write bus: posting %d value(s) for device %s",
+            len(applied),
+            key,
+        )
+        try:
+            await self._client.async_post_device_settings(payload)
+        except Exception as exc:  # noqa: BLE001
+            for entity in applied:
+                entity._write_failed(exc)
+            return
+
+        for entity in applied:
+            entity._write_succeeded()
+
+
+class _ServiceWriteSlot:
+    """Coalescing state of one (service helper, device) key."""
+
+    __slots__ = ("kwargs", "future", "handle", "task")
+
+    def __init__(self) -> None:
+        # merged arguments and outcome of the trailing write, if one is queued
+        self.kwargs: Optional[Dict[str, Any]] = None
+        self.future: Optional[asyncio.Future] = None
+        # quiet timer, re-armed by every call; None once the key went quiet
+        self.handle: Optional[asyncio.TimerHandle] = None
+        # last write started for this key
+        self.task: Optional[asyncio.Task] = None
+
+
+class ServiceWriteCoalescer:
+    """
+    Merges rapid repeated service calls per (helper, device) into few writes.
+
+    The first call for an idle key is written right away. Calls arriving
+    before the key has been quiet for `delay` seconds (e.g. from a slider
+    drag) only update the arguments of one trailing write (latest non-None
+    value wins), sent once the calls stop. Every caller gets the outcome of
+    the write that carried its values; writes for one key run in call order.
+    A key is only released once it is quiet and its last write has finished.
+    """
+
+    def __init__(self, hass: HomeAssistant, delay: float) -> None:
+        self._hass = hass
+        self._delay = delay
+        self._slots: Dict[Tuple[Any, int], _ServiceWriteSlot] = {}
+        # writes in flight, cancelled on unload
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def async_call(
+        self,
+        helper: Callable[..., Awaitable[None]],
+        device_id: int,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Call helper(device_id=..., **kwargs), merged with calls close in time."""
+        key = (helper, device_id)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = _ServiceWriteSlot()
+            future = self._start_write(key, slot, helper, device_id, dict(kwargs))
+        else:
+            if slot.kwargs is None:
+                slot.kwargs = dict(kwargs)
+                slot.future = self._hass.loop.create_future()
+            else:
+                slot.kwargs.update(
+                    (name, value) for name, value in kwargs.items() if value is not None
+                )
+            future = slot.future
+            if slot.handle is not None:
+                slot.handle.cancel()
+        slot.handle = self._hass.loop.call_later(
+            self._delay, self._quiet, key, helper, device_id
+        )
+        # a cancelled caller must not cancel the write shared with others
+        await asyncio.shield(future)
+
+    def cancel(self) -> None:
+        """Drop queued writes and stop running ones (used on config entry unload)."""
+        for slot in self._slots.values():
+            if slot.handle is not None:
+                slot.handle.cancel()
+            if slot.future is not None and not slot.future.done():
+                slot.future.cancel()
+        for task in self._tasks:
+            task.cancel()
+        self._slots.clear()
+        self._tasks.clear()
+
+    @callback
+    def _quiet(
+        self,
+        key: Tuple[Any, int],
+        helper: Callable[..., Awaitable[None]],
+        device_id: int,
+    ) -> None:
+        """Key was quiet for the delay: send the trailing write or release the key."""
+        slot = self._slots[key]
+        if slot.kwargs is None:
+            slot.handle = None
+            self._release_if_idle(key, slot)
+            return
+        kwargs, future = slot.kwargs, slot.future
+        slot.kwargs = slot.future = None
+        self._start_write(key, slot, helper, device_id, kwargs, future)
+        slot.handle = self._hass.loop.call_later(
+            self._delay, self._quiet, key, helper, device_id
+        )
+
+    @callback
+    def _release_if_idle(self, key: Tuple[Any, int], slot: _ServiceWriteSlot) -> None:
+        """Forget the key once it is quiet and no write is in flight.
+
+        While a write is still running the slot stays, so the next write for
+        the key is chained after it instead of racing it.
+        """
+        if (
+            self._slots.get(key) is slot
+            and slot.handle is None
+            and slot.kwargs is None
+            and (slot.task is None or slot.task.done())
+        ):
+            del self._slots[key]
+
+    def _start_write(
+        self,
+        key: Tuple[Any, int],
+        slot: _ServiceWriteSlot,
+        helper: Callable[..., Awaitable[None]],
+        device_id: int,
+        kwargs: Dict[str, Any],
+        future: Optional[asyncio.Future] = None,
+    ) -> asyncio.Future:
+        if future is None:
+            future = self._hass.loop.create_future()
+        task = self._hass.async_create_task(
+            self._async_write(slot.task, helper, device_id, kwargs, future)
+        )
+        slot.task = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(lambda _task: self._release_if_idle(key, slot))
+        return future
+
+    async def _async_write(
+        self,
+        previous: Optional[asyncio.Task],
+        helper: Callable[..., Awaitable[None]],
+        device_id: int,
+        kwargs: Dict[str, Any],
+        future: asyncio.Future,
+    ) -> None:
+        try:
+            if previous is not None and not previous.done():
+                # keep the older value from landing after this one
+                await asyncio.wait((previous,))
+            await helper(device_id=device_id, **kwargs)
+        except Exception as exc:  # noqa: BLE001
+            future.set_exception(exc)
+            # mark retrieved: all callers may have been cancelled meanwhile
+            future.exception()
+        else:
+            future.set_result(None)
+        finally:
+            # cancelled (e.g. on unload): release every waiting caller
+            if not future.done():
+                future.cancel()
+
+
 class DeviceNumberBase(DeviceBase, NumberEntity):
     """
     Base class for device-level numbers with:
@@ -46,6 +320,8 @@ class DeviceNumberBase(DeviceBase, NumberEntity):
             Read the current value from coordinator.data and store it in self._value.
         -   async _async_send_value(self, value: float | int) -> None
             Send the given value to the device (e.g. via AzRouterClient).
+            Batched numbers (_BATCHED_WRITES = True) implement
+            _find_device_payload() and _apply_value() instead.
     Subclasses MAY override:
         -   _clamp(self, value: float | int) -> float | int
             Clamp or snap value to valid range (min/max/step).
@@ -54,6 +330,8 @@ class DeviceNumberBase(DeviceBase, NumberEntity):
     # Default debounce delay in seconds before sending value to the device
     _DEBOUNCE_SECONDS: float = 2.0
     _WRITE_GRACE_SECONDS: float = 6.0
+    # Route writes through the per-device DeviceSettingsWriteBus
+    _BATCHED_WRITES: bool = False
 
     def __init__(
         self,
@@ -88,11 +366,15 @@ class DeviceNumberBase(DeviceBase, NumberEntity):
         # Current numeric value (last known from coordinator or last set)
         self._value: Optional[float] = None
 
-        # Debounce state: pending value + scheduled task
+        # Debounce state: pending value, timer and in-flight send task
         self._pending_value: Optional[float] = None
+        self._debounce_handle: Optional[asyncio.TimerHandle] = None
         self._debounce_task: Optional[asyncio.Task] = None
         self._suppress_coordinator_until: float = 0.0
 
+        # State last written to HA, see _handle_coordinator_update
+        self._last_written_snapshot: Optional[tuple] = None
+
         if debounce_seconds is not None:
             self._DEBOUNCE_SECONDS = float(debounce_seconds)
 
@@ -132,6 +414,49 @@ class DeviceNumberBase(DeviceBase, NumberEntity):
             f"{self.__class__.__name__} must implement _async_send_value()"
         )
 
+    def _find_device_payload(self) -> Optional[dict[str, Any]]:  # pragma: no cover - abstract by convention
+        """
+        Return the current device JSON from coordinator.data (batched writes).
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement _find_device_payload()"
+        )
+
+    def _apply_value(self, payload: dict[str, Any], value: float | int) -> None:  # pragma: no cover - abstract by convention
+        """
+        Write the given value into a copy of the device payload (batched writes).
+
+        May raise to reject the value; other pending values are still sent.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement _apply_value()"
+        )
+
+    # ------------------------------------------------------------------
+    # Write result callbacks
+    # ------------------------------------------------------------------
+
+    def _write_succeeded(self) -> None:
+        """Keep coordinator values suppressed until the device reflects the write."""
+        self._suppress_coordinator_until = max(
+            self._suppress_coordinator_until,
+            monotonic() + self._WRITE_GRACE_SECONDS,
+        )
+
+    def _write_failed(self, exc: Exception) -> None:
+        """Stop suppressing coordinator values so the real state is shown again."""
+        self._suppress_coordinator_until = 0.0
+        _LOGGER.warning(
+            "%s: failed to send value for entity_id=%s: %s",
+            self.__class__.__name__,
+            getattr(self, "entity_id", None),
+            exc,
+        )
+
+    def _write_bus(self) -> Optional[DeviceSettingsWriteBus]:
+        runtime_data = getattr(self._entry, "runtime_data", None)
+        return getattr(runtime_data, "write_bus", None)
+
     # ------------------------------------------------------------------
     # Home Assistant lifecycle
     # ------------------------------------------------------------------
@@ -152,8 +477,15 @@ class DeviceNumberBase(DeviceBase, NumberEntity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up pending tasks when entity is removed."""
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+            self._debounce_handle = None
         if self._debounce_task and not self._debounce_task.done():
             self._debounce_task.cancel()
+        if self._BATCHED_WRITES:
+            bus = self._write_bus()
+            if bus is not None:
+                bus.withdraw(self)
         await super().async_will_remove_from_hass()
 
     def _handle_coordinator_update(self) -> None:
@@ -162,7 +494,7 @@ class DeviceNumberBase(DeviceBase, NumberEntity):
 
         We:
           1) refresh self._value from coordinator.data,
-          2) let the parent update the rest of the entity state.
+          2) let the parent write the entity state, unless it is unchanged.
         """
         now = monotonic()
         if now >= self._suppress_coordinator_until:
@@ -174,13 +506,30 @@ class DeviceNumberBase(DeviceBase, NumberEntity):
                     self.__class__.__name__,
                     exc,
                 )
+
+        # Skip the state machine write when nothing visible changed
+        if self._state_snapshot() == self._last_written_snapshot:
+            return
         super()._handle_coordinator_update()
-        self.async_write_ha_state()
+
+    def _state_snapshot(self) -> tuple:
+        """Values that decide whether HA state needs to be written again."""
+        return (self._value, self.available, self.native_max_value)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        self._last_written_snapshot = self._state_snapshot()
+        super().async_write_ha_state()
 
     # ------------------------------------------------------------------
     # NumberEntity API
     # ------------------------------------------------------------------
 
+    @property
+    def available(self) -> bool:
+        """Unavailable while the coordinator is failing or no value is known yet."""
+        return self.coordinator.last_update_success and self._value is not None
+
     @property
     def native_value(self) -> Optional[float]:
         """Return current numeric value."""
@@ -219,6 +568,13 @@ class DeviceNumberBase(DeviceBase, NumberEntity):
             )
             return
 
+        bus = self._write_bus() if self._BATCHED_WRITES else None
+        if self._BATCHED_WRITES and bus is None:
+            # the bus is created with the config entry, before any entity
+            raise HomeAssistantError(
+                f"{self.__class__.__name__}: settings write bus not available"
+            )
+
         self._value = new_value
         self._pending_value = new_value
         self._suppress_coordinator_until = (
@@ -226,45 +582,46 @@ class DeviceNumberBase(DeviceBase, NumberEntity):
         )
         self.async_write_ha_state()
 
-        # Cancel previous pending send, if any
-        if self._debounce_task and not self._debounce_task.done():
-            self._debounce_task.cancel()
+        if bus is not None:
+            bus.submit(self, new_value, self._DEBOUNCE_SECONDS)
+            return
 
-        async def _send_later() -> None:
-            try:
-                await asyncio.sleep(self._DEBOUNCE_SECONDS)
-                if self._pending_value is None:
-                    return
+        # Re-arm the debounce timer; only the last value gets sent
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+        self._debounce_handle = self.hass.loop.call_later(
+            self._DEBOUNCE_SECONDS, self._debounce_elapsed
+        )
 
-                send_value = self._pending_value
-                _LOGGER.debug(
-                    "%s: debounced send value=%s for entity_id=%s",
-                    self.__class__.__name__,
-                    send_value,
-                    getattr(self, "entity_id", None),
-                )
-                await self._async_send_value(send_value)
-                self._suppress_coordinator_until = max(
-                    self._suppress_coordinator_until,
-                    monotonic() + self._WRITE_GRACE_SECONDS,
-                )
+    @callback
+    def _debounce_elapsed(self) -> None:
+        """Debounce timer fired: start sending the pending value."""
+        self._debounce_handle = None
+        self._debounce_task = self.hass.async_create_task(self._debounced_send())
 
-            except asyncio.CancelledError:
-                _LOGGER.debug(
-                    "%s: debounced send cancelled for entity_id=%s",
-                    self.__class__.__name__,
-                    getattr(self, "entity_id", None),
-                )
-            except Exception as exc:  # noqa: BLE001
-                self._suppress_coordinator_until = 0.0
-                _LOGGER.warning(
-                    "%s: failed to send value for entity_id=%s: %s",
-                    self.__class__.__name__,
-                    getattr(self, "entity_id", None),
-                    exc,
-                )
+    async def _debounced_send(self) -> None:
+        """Send the latest pending value."""
+        try:
+            if self._pending_value is None:
+                return
 
-        # schedule new debounced send
-        self._debounce_task = self.hass.loop.create_task(_send_later())
+            send_value = self._pending_value
+            _LOGGER.debug(
+                "%s: debounced send value=%s for entity_id=%s",
+                self.__class__.__name__,
+                send_value,
+                getattr(self, "entity_id", None),
+            )
+            await self._async_send_value(send_value)
+            self._write_succeeded()
+
+        except asyncio.CancelledError:
+            _LOGGER.debug(
+                "%s: debounced send cancelled for entity_id=%s",
+                self.__class__.__name__,
+                getattr(self, "entity_id", None),
+            )
+        except Exception as exc:  # noqa: BLE001
+            self._write_failed(exc)
 
 # End Of File
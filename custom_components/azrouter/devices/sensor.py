@@ -13,7 +13,6 @@ from __future__ import annotations
 
 from typing import Any, Dict
 import logging
-from types import SimpleNamespace
 
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -25,6 +24,29 @@ from ..entity import BaseEntity, _get_value
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sentinel for "path not present" (None is a valid value)
+_MISSING = object()
+
+
+class _RouterRef:
+    """Router identity exposed to device entities as .router."""
+
+    __slots__ = ("serial_number",)
+
+    def __init__(self, serial_number: str) -> None:
+        self.serial_number = serial_number
+
+
+class _DeviceCfg:
+    """Static device identity exposed to device entities as .device_cfg."""
+
+    __slots__ = ("id", "name", "type")
+
+    def __init__(self, id: Any, name: Any, type: Any) -> None:  # noqa: A002
+        self.id = id
+        self.name = name
+        self.type = type
+
 
 class DeviceBase(BaseEntity):
     """Shared base for all device-level sensors."""
@@ -56,6 +78,11 @@ class DeviceBase(BaseEntity):
 
         self._device = device
         self._raw_path = raw_path
+        # (key, list index or None) per path segment, parsed once
+        self._raw_path_parts = tuple(
+            (part, int(part) if part.lstrip("-").isdigit() else None)
+            for part in raw_path.split(".")
+        ) if raw_path else ()
         self._device_model_override = model
 
         if icon is not None:
@@ -63,15 +90,15 @@ class DeviceBase(BaseEntity):
 
         common = device.get("common", {}) if isinstance(device, dict) else {}
         self._device_id = common.get("id")
-        self._router = SimpleNamespace(
-            serial_number=self._router_id,
-        )
-        self._device_cfg = SimpleNamespace(
+        self._router = _RouterRef(self._router_id)
+        self._device_cfg = _DeviceCfg(
             id=common.get("id"),
             name=common.get("name", f"device-{common.get('id', '?')}"),
             type=common.get("type"),
         )
         self._device_type = str(device.get("deviceType", "unknown"))
+        # key into coordinator.data["devices_by_key"]
+        self._index_key = (self._device_type, str(self._device_id))
 
         dev_id = self._device_cfg.id
         if dev_id is not None:
@@ -81,6 +108,8 @@ class DeviceBase(BaseEntity):
         else:
             self._attr_unique_id = f"{self._router_id}_device_{self._device_type}_X_{key}"
 
+        self._attr_device_info = self._build_device_info()
+
     @property
     def router(self):
         return self._router
@@ -89,8 +118,7 @@ class DeviceBase(BaseEntity):
     def device_cfg(self):
         return self._device_cfg
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _build_device_info(self) -> DeviceInfo:
         if self._device_model_override:
             model = self._device_model_override
         else:
@@ -112,39 +140,41 @@ class DeviceBase(BaseEntity):
     def _read_raw(self) -> Any:
         """Find and return a value from coordinator.data['devices'] for this device."""
         data = self.coordinator.data or {}
+
+        # Fast path: index built by the client on each refresh
+        index = data.get("devices_by_key")
+        if isinstance(index, dict):
+            return self._walk_path(index.get(self._index_key))
+
         devices = data.get("devices") or []
+        self_id = str(self._device_id)
 
+        # entries are validated dicts (see api._valid_devices)
         dev = None
         for d in devices:
-            try:
-                dtype = str(d.get("deviceType", "unknown"))
-                cid_raw = d.get("common", {}).get("id")
-                try:
-                    cid = int(cid_raw)
-                    self_id = int(self._device_id)
-                    id_match = cid == self_id
-                except Exception:
-                    id_match = str(cid_raw) == str(self._device_id)
-
-                if id_match and dtype == self._device_type:
-                    dev = d
-                    break
-            except Exception:
-                continue
-
-        if dev is None:
+            if (
+                str(d["common"].get("id")) == self_id
+                and str(d.get("deviceType", "unknown")) == self._device_type
+            ):
+                dev = d
+                break
+
+        return self._walk_path(dev)
+
+    def _walk_path(self, dev: Any) -> Any:
+        """Follow self._raw_path inside one device dict."""
+        if dev is None or not self._raw_path_parts:
             return None
 
-        parts = self._raw_path.split(".")
         cur: Any = dev
         try:
-            for p in parts:
+            for key, idx in self._raw_path_parts:
                 if isinstance(cur, list):
-                    cur = cur[int(p)]
+                    cur = cur[idx]
                 else:
-                    cur = cur[p]
+                    cur = cur[key]
             return cur
-        except Exception:
+        except (KeyError, IndexError, TypeError):
             return None
 
 
@@ -175,17 +205,19 @@ class MasterBase(BaseEntity):
         )
 
         self._raw_path = raw_path
+        # pre-split for the structured _get_value fallback in _read_raw
+        self._raw_path_keys = tuple(raw_path.split(".")) if raw_path else ()
+        # root of the payload where _get_value last found this path
+        self._value_root: list[str | None] = [None]
+        self._attr_device_info = self._build_device_info()
 
         if icon is not None:
             self._attr_icon = icon
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _build_device_info(self) -> DeviceInfo:
         """Device registry entry for the master unit."""
-        ident = f"{self._router_id}_master"
-
         return DeviceInfo(
-            identifiers={(DOMAIN, ident)},
+            identifiers={(DOMAIN, f"{self._router_id}_master")},
             name="Master",
             manufacturer="A-Z Traders",
             model="A-Z Router Smart master",
@@ -195,26 +227,30 @@ class MasterBase(BaseEntity):
         """Read a value for this master entity based on self._raw_path.
 
         Supports:
+        - path -> value index in coordinator.data["master_index"],
         - flattened list in coordinator.data["master_data"] (path/value pairs),
         - structured lookup via _get_value(...) as a fallback.
         """
-        data = getattr(self.coordinator, "data", None)
+        data = self.coordinator.data
         if not data:
             return None
 
-        # Preferred: flattened master_data list
-        master = data.get("master_data")
-        if isinstance(master, list):
-            for item in master:
-                try:
-                    if item.get("path") == self._raw_path:
+        # Preferred: index built by the client on each refresh
+        index = data.get("master_index")
+        if isinstance(index, dict):
+            value = index.get(self._raw_path, _MISSING)
+            if value is not _MISSING:
+                return value
+        else:
+            # Flattened master_data list (data without an index)
+            master = data.get("master_data")
+            if isinstance(master, list):
+                for item in master:
+                    if isinstance(item, dict) and item.get("path") == self._raw_path:
                         return item.get("value")
-                except Exception:
-                    continue
 
-        # Fallback: try structured lookup in the root payload
-        try:
-            return _get_value(data, self._raw_path)
-        except Exception:
+        # Fallback: structured lookup in the root payload (never raises)
+        if not self._raw_path_keys:
             return None
+        return _get_value(data, self._raw_path_keys, root_cache=self._value_root)
 # End Of File
@@ -11,34 +11,105 @@
 #
 # - MasterSwitchBase:
 #     Base for master-level switches (on the main AZ Router unit).
+#
+# - async_set_device_boosts:
+#     Boost write for several devices at once (set_device_boost service).
+#
+# - _ParsedStateMixin:
+#     Parsed state memoized per coordinator refresh, shared by both bases.
 # -----------------------------------------------------------
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
-import logging
+from typing import Any, Dict, Iterable, Optional
 import asyncio
+import logging
 from time import monotonic
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from ..api import AzRouterClient
+from .helpers import parse_bool
 from .sensor import DeviceBase, MasterBase
 
 _LOGGER = logging.getLogger(__name__)
 
+# Max. boost writes in flight at once, so a multi-device call does not flood the router
+_BOOST_WRITE_CONCURRENCY = 5
+
+
+async def async_set_device_boosts(
+    client: AzRouterClient,
+    device_ids: Iterable[int],
+    value: bool,
+) -> None:
+    """Set boost on several devices with parallel (bounded) API calls.
+
+    All writes are attempted; the first failure is re-raised afterwards.
+    """
+    semaphore = asyncio.Semaphore(_BOOST_WRITE_CONCURRENCY)
+
+    async def _set_one(device_id: int) -> None:
+        async with semaphore:
+            await client.async_set_device_boost(device_id, value)
+
+    results = await asyncio.gather(
+        *(_set_one(device_id) for device_id in device_ids),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+
+
+# ---------------------------------------------------------------------------
+# Shared state parsing
+# ---------------------------------------------------------------------------
+
+class _ParsedStateMixin:
+    """Parsed switch state memoized per coordinator refresh.
+
+    Shared by the device and master switch bases; needs coordinator and
+    _read_raw() from the entity base it is mixed into.
+    """
+
+    # parsed raw state, valid while coordinator.data is the same object
+    _state_data: Any = None
+    _state_value: Optional[bool] = None
+
+    def _raw_state(self) -> Optional[bool]:
+        """Parsed device value, computed once per coordinator refresh."""
+        data = self.coordinator.data
+        if data is None or data is not self._state_data:
+            self._state_value = parse_bool(self._read_raw())
+            self._state_data = data
+        return self._state_value
+
+    def _already_in_state(self, value: bool) -> bool:
+        """True if the coordinator-confirmed state already equals value.
+
+        Lets scenes skip the API round-trip for switches already in place.
+        While an optimistic state is pending the command is always sent, so
+        retrying a write the device ignored is not dropped.
+        """
+        return (
+            self._optimistic_state is None
+            and self.coordinator.last_update_success
+            and self._raw_state() is value
+        )
+
 
 # ---------------------------------------------------------------------------
 # Device-level switch base
 # ---------------------------------------------------------------------------
 
-class DeviceSwitchBase(DeviceBase, SwitchEntity):
+class DeviceSwitchBase(_ParsedStateMixin, DeviceBase, SwitchEntity):
     """Base class for all device-level switches."""
 
-    _REFRESH_DELAY = 4.5  # give API time to settle before forcing a refresh
     _OPTIMISTIC_WINDOW = 8.0
 
     def __init__(
@@ -69,34 +140,15 @@ class DeviceSwitchBase(DeviceBase, SwitchEntity):
         self._optimistic_state: Optional[bool] = None
         self._optimistic_until: float = 0.0
 
-    def _parse_bool(self, value: Any) -> Optional[bool]:
-        """Try to convert raw value to bool, return None if unknown."""
-        if value is None:
-            return None
-
-        try:
-            if isinstance(value, bool):
-                return bool(value)
-            ival = int(value)
-            return ival != 0
-        except Exception:
-            s = str(value).lower()
-            if s in ("on", "true", "yes", "1"):
-                return True
-            if s in ("off", "false", "no", "0"):
-                return False
-        return None
-
     @property
     def is_on(self) -> Optional[bool]:
         """Return the current switch state as boolean, if available."""
         if self._optimistic_state is not None and monotonic() < self._optimistic_until:
             return self._optimistic_state
-        raw = self._read_raw()
-        return self._parse_bool(raw)
+        return self._raw_state()
 
     def _handle_coordinator_update(self) -> None:
-        raw = self._parse_bool(self._read_raw())
+        raw = self._raw_state()
         if self._optimistic_state is not None:
             now = monotonic()
             if raw is not None and raw == self._optimistic_state:
@@ -112,7 +164,11 @@ class DeviceSwitchBase(DeviceBase, SwitchEntity):
         raise NotImplementedError()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the switch on and request a refresh afterwards."""
+        """Turn the switch on and schedule a refresh afterwards."""
+        if self._already_in_state(True):
+            # no write needed; still confirm the state with a refresh
+            self._schedule_refresh()
+            return
         self._optimistic_state = True
         self._optimistic_until = monotonic() + self._OPTIMISTIC_WINDOW
         self.async_write_ha_state()
@@ -124,17 +180,19 @@ class DeviceSwitchBase(DeviceBase, SwitchEntity):
             self.async_write_ha_state()
             _LOGGER.error(
                 "DeviceSwitchBase: failed to send ON value for %s: %s",
-                getattr(self, "_attr_unique_id", "?"),
+                self._attr_unique_id,
                 exc,
             )
             raise HomeAssistantError(str(exc)) from exc
 
-        if self._REFRESH_DELAY > 0:
-            await asyncio.sleep(self._REFRESH_DELAY)
-        await self.coordinator.async_request_refresh()
+        self._schedule_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the switch off and request a refresh afterwards."""
+        """Turn the switch off and schedule a refresh afterwards."""
+        if self._already_in_state(False):
+            # no write needed; still confirm the state with a refresh
+            self._schedule_refresh()
+            return
         self._optimistic_state = False
         self._optimistic_until = monotonic() + self._OPTIMISTIC_WINDOW
         self.async_write_ha_state()
@@ -146,14 +204,12 @@ class DeviceSwitchBase(DeviceBase, SwitchEntity):
             self.async_write_ha_state()
             _LOGGER.error(
                 "DeviceSwitchBase: failed to send OFF value for %s: %s",
-                getattr(self, "_attr_unique_id", "?"),
+                self._attr_unique_id,
                 exc,
             )
             raise HomeAssistantError(str(exc)) from exc
 
-        if self._REFRESH_DELAY > 0:
-            await asyncio.sleep(self._REFRESH_DELAY)
-        await self.coordinator.async_request_refresh()
+        self._schedule_refresh()
 
 
 class DeviceBoostSwitch(DeviceSwitchBase):
@@ -199,10 +255,9 @@ class DeviceBoostSwitch(DeviceSwitchBase):
 # Master-level switch base
 # ---------------------------------------------------------------------------
 
-class MasterSwitchBase(MasterBase, SwitchEntity):
+class MasterSwitchBase(_ParsedStateMixin, MasterBase, SwitchEntity):
     """Base class for master-level switches (on the main AZ Router unit)."""
 
-    _REFRESH_DELAY = 4.5  # give API time to settle before forcing a refresh
     _OPTIMISTIC_WINDOW = 8.0
 
     def __init__(
@@ -230,35 +285,25 @@ class MasterSwitchBase(MasterBase, SwitchEntity):
         self._attr_assumed_state = False
         self._optimistic_state: Optional[bool] = None
         self._optimistic_until: float = 0.0
-
-    def _parse_bool(self, value: Any) -> Optional[bool]:
-        """Try to convert raw value to bool, return None if unknown."""
-        if value is None:
-            return None
-
-        try:
-            if isinstance(value, bool):
-                return bool(value)
-            ival = int(value)
-            return ival != 0
-        except Exception:
-            s = str(value).lower()
-            if s in ("on", "true", "yes", "1"):
-                return True
-            if s in ("off", "false", "no", "0"):
-                return False
-        return None
+        # state from the last successful refresh, used while data is stale
+        self._last_is_on: Optional[bool] = None
+        # (is_on, available) last written to HA
+        self._last_written_snapshot: Optional[tuple] = None
 
     @property
     def is_on(self) -> Optional[bool]:
         """Return the current switch state as boolean, if available."""
         if self._optimistic_state is not None and monotonic() < self._optimistic_until:
             return self._optimistic_state
-        raw = self._read_raw()
-        return self._parse_bool(raw)
+        if not self.coordinator.last_update_success:
+            # stale data: keep the last state read from a good refresh
+            return self._last_is_on
+        return self._raw_state()
 
     def _handle_coordinator_update(self) -> None:
-        raw = self._parse_bool(self._read_raw())
+        raw = self._raw_state()
+        if self.coordinator.last_update_success:
+            self._last_is_on = raw
         if self._optimistic_state is not None:
             now = monotonic()
             if raw is not None and raw == self._optimistic_state:
@@ -267,14 +312,27 @@ class MasterSwitchBase(MasterBase, SwitchEntity):
             elif now >= self._optimistic_until:
                 self._optimistic_state = None
                 self._optimistic_until = 0.0
+
+        # Skip the state machine write when nothing visible changed
+        if (self.is_on, self.available) == self._last_written_snapshot:
+            return
         super()._handle_coordinator_update()
 
+    @callback
+    def async_write_ha_state(self) -> None:
+        self._last_written_snapshot = (self.is_on, self.available)
+        super().async_write_ha_state()
+
     async def _send_value(self, value: bool) -> None:  # pragma: no cover - abstract
         """Send new state to the master unit. Must be implemented by subclasses."""
         raise NotImplementedError()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the switch on and request a refresh afterwards."""
+        """Turn the switch on and schedule a refresh afterwards."""
+        if self._already_in_state(True):
+            # no write needed; still confirm the state with a refresh
+            self._schedule_refresh()
+            return
         self._optimistic_state = True
         self._optimistic_until = monotonic() + self._OPTIMISTIC_WINDOW
         self.async_write_ha_state()
@@ -286,17 +344,19 @@ class MasterSwitchBase(MasterBase, SwitchEntity):
             self.async_write_ha_state()
             _LOGGER.error(
                 "MasterSwitchBase: failed to send ON value for %s: %s",
-                getattr(self, "_attr_unique_id", "?"),
+                self._attr_unique_id,
                 exc,
             )
             raise HomeAssistantError(str(exc)) from exc
 
-        if self._REFRESH_DELAY > 0:
-            await asyncio.sleep(self._REFRESH_DELAY)
-        await self.coordinator.async_request_refresh()
+        self._schedule_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the switch off and request a refresh afterwards."""
+        """Turn the switch off and schedule a refresh afterwards."""
+        if self._already_in_state(False):
+            # no write needed; still confirm the state with a refresh
+            self._schedule_refresh()
+            return
         self._optimistic_state = False
         self._optimistic_until = monotonic() + self._OPTIMISTIC_WINDOW
         self.async_write_ha_state()
@@ -308,12 +368,10 @@ class MasterSwitchBase(MasterBase, SwitchEntity):
             self.async_write_ha_state()
             _LOGGER.error(
                 "MasterSwitchBase: failed to send OFF value for %s: %s",
-                getattr(self, "_attr_unique_id", "?"),
+                self._attr_unique_id,
                 exc,
             )
             raise HomeAssistantError(str(exc)) from exc
 
-        if self._REFRESH_DELAY > 0:
-            await asyncio.sleep(self._REFRESH_DELAY)
-        await self.coordinator.async_request_refresh()
+        self._schedule_refresh()
 # End Of File
@@ -53,24 +53,30 @@ class BaseEntity(CoordinatorEntity):
         # state_class for sensors - concrete classes set this if needed
         self._state_class = None
 
-    def _build_router_id(self) -> str:
-        """Build stable router ID from configured host."""
-        host = str(self._entry.data.get("host", "")).strip()
-        parsed = urlparse(host if "://" in host else f"http://{host}")
-        netloc = (parsed.netloc or parsed.path or "unknown").rstrip("/").lower()
-        return netloc
-
-    @property
-    def device_info(self) -> DeviceInfo:
+        # Device registry entry, built once; device/master bases set their own
         ident = f"{self._router_id}"
         if self._device_key:
             ident = f"{self._router_id}_{self._device_key}"
 
-        info: DeviceInfo = {
+        self._attr_device_info: DeviceInfo = {
             "identifiers": {(DOMAIN, ident)},
             "manufacturer": "A-Z Traders",
             "name": "A-Z Router" + (f" - {self._device_key.capitalize()}" if self._device_key else ""),
             "model": "A-Z Router Smart",
         }
-        return info
+
+    def _schedule_refresh(self) -> None:
+        """Refresh coordinator data later without holding up the service call.
+
+        All writable entities of an entry share one debouncer, so several
+        writes (e.g. from a scene) result in a single refresh.
+        """
+        self._entry.runtime_data.refresh_debouncer.async_schedule_call()
+
+    def _build_router_id(self) -> str:
+        """Build stable router ID from configured host."""
+        host = str(self._entry.data.get("host", "")).strip()
+        parsed = urlparse(host if "://" in host else f"http://{host}")
+        netloc = (parsed.netloc or parsed.path or "unknown").rstrip("/").lower()
+        return netloc
 # End Of File
@@ -9,9 +9,9 @@
 
 from __future__ import annotations
 
-from typing import List, Any, Dict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Sequence
+import asyncio
 import logging
-import copy
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -25,6 +25,8 @@ from .api import AzRouterClient
 from .devices.master.number import create_master_numbers
 from .devices.device_type_1.number import create_device_type_1_numbers
 from .devices.device_type_4.number import create_device_type_4_numbers
+from .devices.device_type_4.helpers import MODE_MANUAL, ensure_mode_entry, get_mode_entry
+from .devices.number import ServiceWriteCoalescer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,7 +41,7 @@ async def async_setup_entry(
     runtime_data = entry.runtime_data
     if runtime_data is None:
         _LOGGER.debug("number: runtime_data missing for entry %s", entry.entry_id)
-        async_add_entities([], True)
+        async_add_entities([], update_before_add=False)
         return
 
     client: AzRouterClient = runtime_data.client
@@ -53,39 +55,32 @@ async def async_setup_entry(
     except Exception as exc:  # noqa: BLE001
         _LOGGER.debug("number: wallbox number name migration skipped: %s", exc)
 
-    entities: List[Any] = []
-
-    # --- MASTER NUMBER ENTITIES ---
-    entities.extend(
-        create_master_numbers(
+    # Built in one go from the per-type factories
+    entities: List[Any] = [
+        # --- MASTER NUMBER ENTITIES ---
+        *create_master_numbers(
             client=client,
             coordinator=coordinator,
             entry=entry,
-        )
-    )
-
-    # --- DEVICE_TYPE_1 NUMBER ENTITIES ---
-    entities.extend(
-        create_device_type_1_numbers(
+        ),
+        # --- DEVICE_TYPE_1 NUMBER ENTITIES ---
+        *create_device_type_1_numbers(
             client=client,
             coordinator=coordinator,
             entry=entry,
             devices=devices_list,
-        )
-    )
-
-    # --- DEVICE_TYPE_4 NUMBER ENTITIES ---
-    entities.extend(
-        create_device_type_4_numbers(
+        ),
+        # --- DEVICE_TYPE_4 NUMBER ENTITIES ---
+        *create_device_type_4_numbers(
             client=client,
             coordinator=coordinator,
             entry=entry,
             devices=devices_list,
-        )
-    )
+        ),
+    ]
 
     if entities:
-        async_add_entities(entities, True)
+        async_add_entities(entities, update_before_add=False)
 
 
 def _migrate_wallbox_number_names(
@@ -136,6 +131,168 @@ def _migrate_wallbox_number_names(
 #  SERVICE HELPERS – used by __init__.py
 # ======================================================================
 
+def _find_coordinator_device(
+    coordinator,
+    device_id: int,
+    device_type: str,
+) -> Dict[str, Any] | None:
+    """Return the device dict for (device_type, device_id) from coordinator data.
+
+    Uses the devices_by_key index built by the client on each refresh.
+    """
+    data = coordinator.data or {}
+    try:
+        id_int = device_id if type(device_id) is int else int(device_id)
+    except (TypeError, ValueError):
+        return None
+    key = str(id_int)
+
+    index = data.get("devices_by_key")
+    if isinstance(index, dict):
+        return index.get((device_type, key))
+
+    # Scan without an index; entries are validated dicts (see api._valid_devices)
+    for dev in data.get("devices") or []:
+        if not _type_matches(dev.get("deviceType"), device_type):
+            continue
+        cid = dev["common"].get("id")
+        if cid == id_int or (type(cid) is str and cid == key):
+            return dev
+    return None
+
+
+def _minimal_device_payload(
+    root: Dict[str, Any],
+    device_id: int,
+    device_type: str,
+    **sections: Any,
+) -> Dict[str, Any]:
+    """Device settings payload with identity plus only the given sections.
+
+    Used for deviceType 1 settings writes, which the router applies from a
+    partial payload. Not for chargers: partial deviceType 4 payloads do not
+    always persist, so those services post the whole device.
+    """
+    return {
+        "deviceType": root.get("deviceType", device_type),
+        "common": root.get("common", {"id": device_id}),
+        **sections,
+    }
+
+
+def _clone_path(obj: Any, spec: Sequence[str]) -> Any:
+    """Copy the containers along one path; "*" walks every list item."""
+    if not spec:
+        if isinstance(obj, dict):
+            return dict(obj)
+        if isinstance(obj, list):
+            return list(obj)
+        return obj
+
+    head, rest = spec[0], spec[1:]
+    if head == "*":
+        if isinstance(obj, list):
+            return [_clone_path(item, rest) for item in obj]
+        return obj
+    if isinstance(obj, dict):
+        obj = dict(obj)
+        if head in obj:
+            obj[head] = _clone_path(obj[head], rest)
+    return obj
+
+
+def _shallow_path_clone(root: Dict[str, Any], path_specs: Sequence[Sequence[str]]) -> Dict[str, Any]:
+    """Return a copy of root that is safe to mutate along path_specs.
+
+    Only dicts/lists on the given paths are copied, everything else stays
+    shared with the coordinator data (cheaper than copy.deepcopy(root)).
+    """
+    out = dict(root)
+    for spec in path_specs:
+        out = _clone_path(out, spec)
+    return out
+
+
+def _type_matches(raw_type: Any, device_type: str) -> bool:
+    """Compare a raw deviceType (int or str) with a str type without str()."""
+    if type(raw_type) is str:
+        return raw_type == device_type
+    return raw_type is not None and str(raw_type) == device_type
+
+
+def _coerce_int(value: Any) -> int:
+    """int() with a fast path for ints (service schemas mostly pass numbers).
+
+    Raises TypeError/ValueError for values that are not numeric.
+    """
+    if type(value) is int:
+        return value
+    return int(value)
+
+
+def _clamp(value: int, low: int, high: int) -> int:
+    """Limit value to low..high."""
+    return min(max(value, low), high)
+
+
+async def async_service_for_devices(
+    helper: Callable[..., Awaitable[None]],
+    device_ids: Iterable[int],
+    *,
+    coalescer: ServiceWriteCoalescer | None = None,
+    **kwargs: Any,
+) -> None:
+    """Run one service helper for several devices concurrently.
+
+    Every device is looked up, built and POSTed independently (with a
+    coalescer, rapid repeated calls per device are merged, see
+    ServiceWriteCoalescer); failures are logged per device and the first one
+    is re-raised after all have finished.
+    """
+    device_ids = list(device_ids)
+    if coalescer is not None:
+        calls = (coalescer.async_call(helper, device_id, kwargs) for device_id in device_ids)
+    else:
+        calls = (helper(device_id=device_id, **kwargs) for device_id in device_ids)
+    results = await asyncio.gather(*calls, return_exceptions=True)
+
+    first_error: BaseException | None = None
+    for device_id, result in zip(device_ids, results):
+        if isinstance(result, BaseException):
+            _LOGGER.debug(
+                "Service %s failed for device %s: %s",
+                helper.__name__,
+                device_id,
+                result,
+            )
+            if first_error is None:
+                first_error = result
+    if first_error is not None:
+        raise first_error
+
+
+def _int_or_none(value: Any) -> int | None:
+    """_coerce_int() that returns None for missing/non-numeric values."""
+    try:
+        return _coerce_int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _power_settings_match(settings: Any, expected: Dict[str, int]) -> bool:
+    """True if every settings[*].power already holds the expected values."""
+    if not isinstance(settings, list) or not settings:
+        return False
+    for entry in settings:
+        power = entry.get("power") if isinstance(entry, dict) else None
+        if not isinstance(power, dict):
+            return False
+        for key, value in expected.items():
+            if _int_or_none(power.get(key)) != value:
+                return False
+    return True
+
+
 # same limits as in DeviceType1MaxPowerNumber
 MIN_MAXPOWER = 100
 MAX_MAXPOWER = 3500
@@ -144,210 +301,192 @@ MAX_MAXPOWER = 3500
 TEMP_MIN = 20
 TEMP_MAX = 85
 
+# settings fallback when a device reports none (summer/winter); read-only,
+# the payload builders copy each entry before changing it
+_EMPTY_SETTINGS = ({}, {})
 
-async def async_service_set_device_type_1_max_power(
+
+def _temperature_or_none(value: int | None) -> int | None:
+    """Clamp a requested temperature to TEMP_MIN..TEMP_MAX; None/0/invalid -> None."""
+    if value in (None, 0):
+        return None
+    try:
+        return _clamp(_coerce_int(value), TEMP_MIN, TEMP_MAX)
+    except (TypeError, ValueError):
+        return None
+
+
+def _get_type1_root(coordinator, device_id: int) -> Dict[str, Any]:
+    """device_type_1 payload from coordinator data, or ServiceValidationError."""
+    root = _find_coordinator_device(coordinator, device_id, "1")
+    if not root:
+        raise ServiceValidationError(
+            f"Device {device_id} not found in coordinator data."
+        )
+    return root
+
+
+async def async_service_set_device_type_1_all(
     *,
     hass,
     client: AzRouterClient,
     coordinator,
     device_id: int,
-    max_power: int | None,
+    max_power: int | None = None,
+    target_temperature: int | None = None,
+    boost_temperature: int | None = None,
+    action: str = "set_device_type_1_settings",
 ) -> None:
-    """Service helper: set power.maxPower for device_type_1."""
+    """Service helper: set max power and/or temperatures with a single POST.
 
-    if max_power is None:
-        raise ServiceValidationError(
-            f"Missing max_power for device {device_id}."
-        )
+    max_power goes to power.maxPower and settings[*].power.max, temperatures
+    to settings[*].power.targetTemperature / targetTemperatureBoost.
+    Fields that are None (temperatures also 0) are left unchanged.
+    """
 
-    # clamp to valid range
-    try:
-        value = int(max_power)
-    except Exception:
-        raise ServiceValidationError(
-            f"Invalid max_power '{max_power}' for device {device_id}."
-        )
+    value: int | None = None
+    if max_power is not None:
+        # clamp to valid range
+        try:
+            value = _clamp(_coerce_int(max_power), MIN_MAXPOWER, MAX_MAXPOWER)
+        except (TypeError, ValueError):
+            raise ServiceValidationError(
+                f"Invalid max_power '{max_power}' for device {device_id}."
+            )
 
-    if value < MIN_MAXPOWER:
-        value = MIN_MAXPOWER
-    if value > MAX_MAXPOWER:
-        value = MAX_MAXPOWER
+    root = _get_type1_root(coordinator, device_id)
 
-    data = coordinator.data or {}
-    devices = data.get("devices") or []
+    settings_src = root.get("settings") or []
+    has_settings = isinstance(settings_src, list) and bool(settings_src)
 
-    root: Dict[str, Any] | None = None
-    for dev in devices:
-        try:
-            if (
-                str(dev.get("deviceType")) == "1"
-                and int(dev.get("common", {}).get("id", -1)) == int(device_id)
-            ):
-                root = dev
-                break
-        except Exception:
-            continue
+    # --- clamp requested values up front ---
+    v_target = _temperature_or_none(target_temperature)
+    v_boost = _temperature_or_none(boost_temperature)
 
-    if not root:
+    if (v_target is not None or v_boost is not None) and not has_settings:
         raise ServiceValidationError(
-            f"Device {device_id} not found in coordinator data."
+            f"No settings found for device {device_id}."
         )
 
-    # build payload similar to DeviceType1MaxPowerNumber
-    dev_payload = copy.deepcopy(root)
-
-    # 1) power.maxPower
-    power = dev_payload.setdefault("power", {})
-    power["maxPower"] = int(value)
+    # settings[*].power fields to write
+    expected: Dict[str, int] = {}
+    if value is not None:
+        expected["max"] = value
+    if v_target is not None:
+        expected["targetTemperature"] = v_target
+    if v_boost is not None:
+        expected["targetTemperatureBoost"] = v_boost
+
+    if not expected:
+        _LOGGER.debug("Service %s: no changes for device %s", action, device_id)
+        return
 
-    # 2) settings[*].power.max – keep it in sync with maxPower
-    settings_list = dev_payload.setdefault("settings", [])
-    if not isinstance(settings_list, list):
-        settings_list = []
-        dev_payload["settings"] = settings_list
+    # nothing to write when the device already reports these values
+    if (
+        coordinator.last_update_success
+        and (
+            value is None
+            or _int_or_none((root.get("power") or {}).get("maxPower")) == value
+        )
+        and _power_settings_match(settings_src, expected)
+    ):
+        _LOGGER.debug(
+            "Service %s: device %s already at requested values, skipping",
+            action,
+            device_id,
+        )
+        return
 
-    if not settings_list:
+    if not has_settings:
         # minimal fallback – two entries (e.g. summer/winter)
-        settings_list.extend([{"power": {}}, {"power": {}}])
-
-    for s in settings_list:
-        p = s.setdefault("power", {})
-        p["max"] = int(value)
+        settings_src = _EMPTY_SETTINGS
+
+    # one pass over settings; copies only the parts that change so
+    # coordinator.data is untouched
+    power = dict(root.get("power") or {})
+    if value is not None:
+        power["maxPower"] = value
+    settings_list = [
+        {**entry, "power": {**(entry.get("power") or {}), **expected}}
+        for entry in settings_src
+    ]
 
     _LOGGER.debug(
-        "Service set_device_type_1_max_power: device %s → maxPower=%s",
+        "Service %s: device %s → maxPower=%s, targetTemperature=%s, targetTemperatureBoost=%s",
+        action,
         device_id,
         value,
+        v_target,
+        v_boost,
+    )
+
+    device_payload = _minimal_device_payload(
+        root,
+        device_id,
+        "1",
+        power=power,
+        settings=settings_list,
     )
 
     try:
-        await client.async_post_device_settings(dev_payload)
+        await client.async_post_device_settings(device_payload)
     except Exception as exc:
         _LOGGER.error(
-            "Service set_device_type_1_max_power: write failed for device %s: %s",
+            "Service %s: write failed for device %s: %s",
+            action,
             device_id,
             exc,
         )
         raise HomeAssistantError(
-            f"Failed to write max power for device {device_id}: {exc}"
+            f"Failed to write settings for device {device_id}: {exc}"
         ) from exc
 
 
-async def async_service_set_device_type_1_temperatures(
+async def async_service_set_device_type_1_max_power(
     *,
     hass,
     client: AzRouterClient,
     coordinator,
     device_id: int,
-    target_temperature: int | None,
-    boost_temperature: int | None,
+    max_power: int | None,
 ) -> None:
-    """Service helper: set targetTemperature and/or targetTemperatureBoost."""
-
-    data = coordinator.data or {}
-    devices = data.get("devices") or []
-
-    root: Dict[str, Any] | None = None
-    for dev in devices:
-        try:
-            if (
-                str(dev.get("deviceType")) == "1"
-                and int(dev.get("common", {}).get("id", -1)) == int(device_id)
-            ):
-                root = dev
-                break
-        except Exception:
-            continue
-
-    if not root:
-        raise ServiceValidationError(
-            f"Device {device_id} not found in coordinator data."
-        )
+    """Service helper: set power.maxPower for device_type_1."""
 
-    # work on a copy so we don't mutate coordinator.data in place
-    settings_src = root.get("settings") or []
-    if not isinstance(settings_src, list) or not settings_src:
+    if max_power is None:
         raise ServiceValidationError(
-            f"No settings found for device {device_id}."
+            f"Missing max_power for device {device_id}."
         )
 
-    settings_list = copy.deepcopy(settings_src)
-
-    changed = False
-
-    # --- Target Temperature ---
-    if target_temperature not in (None, 0):
-        try:
-            v = int(target_temperature)
-        except Exception:
-            v = None
-
-        if v is not None:
-            if v < TEMP_MIN:
-                v = TEMP_MIN
-            if v > TEMP_MAX:
-                v = TEMP_MAX
-
-            for entry in settings_list:
-                power = entry.setdefault("power", {})
-                power["targetTemperature"] = v
-
-            _LOGGER.debug(
-                "Service set_device_type_1_temperatures: device %s → targetTemperature=%s",
-                device_id,
-                v,
-            )
-            changed = True
-
-    # --- Boost Target Temperature ---
-    if boost_temperature not in (None, 0):
-        try:
-            v2 = int(boost_temperature)
-        except Exception:
-            v2 = None
-
-        if v2 is not None:
-            if v2 < TEMP_MIN:
-                v2 = TEMP_MIN
-            if v2 > TEMP_MAX:
-                v2 = TEMP_MAX
-
-            for entry in settings_list:
-                power = entry.setdefault("power", {})
-                power["targetTemperatureBoost"] = v2
-
-            _LOGGER.debug(
-                "Service set_device_type_1_temperatures: device %s → targetTemperatureBoost=%s",
-                device_id,
-                v2,
-            )
-            changed = True
+    await async_service_set_device_type_1_all(
+        hass=hass,
+        client=client,
+        coordinator=coordinator,
+        device_id=device_id,
+        max_power=max_power,
+        action="set_device_type_1_max_power",
+    )
 
-    if not changed:
-        _LOGGER.debug(
-            "Service set_device_type_1_temperatures: no changes for device %s",
-            device_id,
-        )
-        return
 
-    device_payload = {
-        "deviceType": "1",
-        "common": root.get("common", {"id": device_id}),
-        "power": root.get("power", {}),
-        "settings": settings_list,
-    }
+async def async_service_set_device_type_1_temperatures(
+    *,
+    hass,
+    client: AzRouterClient,
+    coordinator,
+    device_id: int,
+    target_temperature: int | None,
+    boost_temperature: int | None,
+) -> None:
+    """Service helper: set targetTemperature and/or targetTemperatureBoost."""
 
-    try:
-        await client.async_post_device_settings(device_payload)
-    except Exception as exc:
-        _LOGGER.error(
-            "Service set_device_type_1_temperatures: write failed for device %s: %s",
-            device_id,
-            exc,
-        )
-        raise HomeAssistantError(
-            f"Failed to write temperatures for device {device_id}: {exc}"
-        ) from exc
+    await async_service_set_device_type_1_all(
+        hass=hass,
+        client=client,
+        coordinator=coordinator,
+        device_id=device_id,
+        target_temperature=target_temperature,
+        boost_temperature=boost_temperature,
+        action="set_device_type_1_temperatures",
+    )
 
 # ----------------------------------------------------------------------
 #  SERVICE HELPER – device_type_4 manual charging power (mode id=1)
@@ -362,9 +501,29 @@ CB_TO_MAX_POWER = {
     24: 5500,
     32: 7400,
 }
+# used when the reported breaker is not in CB_TO_MAX_POWER
+_CB_MAX_FALLBACK = max(CB_TO_MAX_POWER.values())
 MANUAL_MIN_POWER_W = 1400
 
 
+def _manual_mode_matches(settings: Any, value: int) -> bool:
+    """True if every settings[*] has manual mode (id=1) enabled at value."""
+    if not isinstance(settings, list) or not settings:
+        return False
+    for entry in settings:
+        charge = entry.get("charge") if isinstance(entry, dict) else None
+        if not isinstance(charge, dict):
+            return False
+        manual = get_mode_entry(charge, MODE_MANUAL)
+        if (
+            manual is None
+            or _int_or_none(manual.get("enabled")) != 1
+            or _int_or_none(manual.get("power")) != value
+        ):
+            return False
+    return True
+
+
 async def async_service_set_device_type_4_manual_power(
     *,
     hass,
@@ -380,20 +539,7 @@ async def async_service_set_device_type_4_manual_power(
             "No power value specified for Charger manual power service."
         )
 
-    data = coordinator.data or {}
-    devices = data.get("devices") or []
-
-    root: Dict[str, Any] | None = None
-    for dev in devices:
-        try:
-            if (
-                str(dev.get("deviceType")) == DEVICE_TYPE_4
-                and int(dev.get("common", {}).get("id", -1)) == int(device_id)
-            ):
-                root = dev
-                break
-        except Exception:
-            continue
+    root = _find_coordinator_device(coordinator, device_id, DEVICE_TYPE_4)
 
     if not root:
         _LOGGER.warning(
@@ -419,13 +565,11 @@ async def async_service_set_device_type_4_manual_power(
     charge = root.get("charge", {}) or {}
     cb_value = int(charge.get("circuitBreaker", 16))
 
-    max_limit = CB_TO_MAX_POWER.get(cb_value)
-    if max_limit is None:
-        max_limit = max(CB_TO_MAX_POWER.values())
+    max_limit = CB_TO_MAX_POWER.get(cb_value, _CB_MAX_FALLBACK)
 
     try:
-        value = int(manual_power)
-    except Exception:
+        value = _coerce_int(manual_power)
+    except (TypeError, ValueError):
         _LOGGER.warning(
             "Service set_device_type_4_manual_power: invalid value '%s' for device %s",
             manual_power,
@@ -451,9 +595,18 @@ async def async_service_set_device_type_4_manual_power(
         )
         value = max_limit
 
-    dev_payload = copy.deepcopy(root)
+    if coordinator.last_update_success and _manual_mode_matches(root.get("settings"), value):
+        _LOGGER.debug(
+            "Service set_device_type_4_manual_power: device %s already at %s W, skipping",
+            device_id,
+            value,
+        )
+        return
+
+    # copy only the containers on the settings[*].charge.mode[*] path
+    cloned = _shallow_path_clone(root, [("settings", "*", "charge", "mode", "*")])
 
-    settings_list = dev_payload.get("settings") or []
+    settings_list = cloned.get("settings") or []
     if not isinstance(settings_list, list) or not settings_list:
         _LOGGER.warning(
             "Service set_device_type_4_manual_power: no settings found for device %s",
@@ -467,27 +620,9 @@ async def async_service_set_device_type_4_manual_power(
 
     for entry in settings_list:
         charge_settings = entry.setdefault("charge", {})
-        mode_list = charge_settings.get("mode")
-
-        if not isinstance(mode_list, list):
-            mode_list = []
-            charge_settings["mode"] = mode_list
-
-        manual_mode = None
-        for mode in mode_list:
-            try:
-                if int(mode.get("id", -1)) == 1:
-                    manual_mode = mode
-                    break
-            except Exception:
-                continue
-
-        if manual_mode is None:
-            manual_mode = {"id": 1}
-            mode_list.append(manual_mode)
-
+        manual_mode = ensure_mode_entry(charge_settings, MODE_MANUAL)
         manual_mode["enabled"] = 1
-        manual_mode["power"] = int(value)
+        manual_mode["power"] = value
         changed = True
 
     if not changed:
@@ -506,8 +641,10 @@ async def async_service_set_device_type_4_manual_power(
         max_limit,
     )
 
+    # Full device: partial charger payloads do not always persist on the
+    # router (see AzRouterClient.async_set_device_type_4_trigger_phase)
     try:
-        await client.async_post_device_settings(dev_payload)
+        await client.async_post_device_settings(cloned)
     except Exception as exc:
         _LOGGER.error(
             "Service set_device_type_4_manual_power: write failed for device %s: %s",
@@ -22,7 +22,7 @@ async def async_setup_entry(
     runtime_data = entry.runtime_data
     if runtime_data is None:
         _LOGGER.debug("select: runtime_data missing for entry %s", entry.entry_id)
-        async_add_entities([], True)
+        async_add_entities([], update_before_add=False)
         return
 
     client = runtime_data.client
@@ -31,22 +31,19 @@ async def async_setup_entry(
         coordinator.data.get("devices") if coordinator.data else []
     ) or []
 
-    entities = []
-    entities.extend(
-        create_device_type_1_select_entities(
+    entities = [
+        *create_device_type_1_select_entities(
             client=client,
             coordinator=coordinator,
             entry=entry,
             devices=devices_list,
-        )
-    )
-    entities.extend(
-        create_device_type_4_select_entities(
+        ),
+        *create_device_type_4_select_entities(
             client=client,
             coordinator=coordinator,
             entry=entry,
             devices=devices_list,
-        )
-    )
+        ),
+    ]
     if entities:
-        async_add_entities(entities, True)
+        async_add_entities(entities, update_before_add=False)
@@ -1,6 +1,7 @@
 # custom_components/azrouter/sensor.py
 from __future__ import annotations
-from typing import Any, List
+from typing import Any, Awaitable, List
+import asyncio
 import logging
 
 from homeassistant.core import HomeAssistant
@@ -16,6 +17,14 @@ from .devices.device_generic import sensor as device_generic_sensor
 
 _LOGGER = logging.getLogger(__name__)
 
+# deviceType -> (log name, per-device entity factory); other types use the generic one
+_HANDLERS = {
+    "1": ("device_type_1", device_type_1_sensor.async_create_device_entities),
+    "4": ("device_type_4", device_type_4_sensor.async_create_device_entities),
+    "5": ("device_type_5", device_type_5_sensor.async_create_device_entities),
+}
+_GENERIC_HANDLER = ("generic device", device_generic_sensor.async_create_device_entities)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -34,144 +43,103 @@ async def async_setup_entry(
     runtime_data = entry.runtime_data
     if runtime_data is None:
         _LOGGER.debug("runtime_data missing for entry %s", entry.entry_id)
-        async_add_entities([], True)
+        async_add_entities([], update_before_add=False)
         return
     coordinator = runtime_data.coordinator
+    # per-device debug lines are skipped entirely unless DEBUG is enabled
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
-    entities: List[Any] = []
-
-    # 1) master-level sensors
-    try:
-        created = await master_sensor.async_create_entities(coordinator, entry)
-        if isinstance(created, list):
-            entities.extend(created)
-            _LOGGER.debug("master sensor handler created %d entities", len(created))
-        else:
+    async def _create_master() -> List[Any]:
+        try:
+            created = await master_sensor.async_create_entities(coordinator, entry)
+            if isinstance(created, list):
+                if debug:
+                    _LOGGER.debug("master sensor handler created %d entities", len(created))
+                return created
             _LOGGER.warning(
                 "master_sensor.async_create_entities returned non-list (%s)",
                 type(created),
             )
-    except Exception as exc:  # noqa: BLE001
-        _LOGGER.exception("exception while creating master entities: %s", exc)
-
-    # 2) device-level sensors
-    devices_list = coordinator.data.get("devices") if coordinator.data else []
-    if not isinstance(devices_list, (list, tuple)):
-        _LOGGER.debug("devices_list is not a list/tuple -> ignoring")
-        devices_list = []
-
-    _LOGGER.debug("creating device sensors for %d devices", len(devices_list))
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.exception("exception while creating master entities: %s", exc)
+        return []
 
-    for dev in devices_list:
+    async def _create_for_device(dev: Any) -> List[Any]:
         try:
             if not isinstance(dev, dict):
-                _LOGGER.debug("skipping non-dict device entry: %r", dev)
-                continue
+                if debug:
+                    _LOGGER.debug("skipping non-dict device entry (%s)", type(dev).__name__)
+                return []
 
             dtype = str(dev.get("deviceType", "")).strip()
             common = dev.get("common") or {}
             dev_name = common.get("name", f"device-{common.get('id', '?')}")
-            _LOGGER.debug("processing device type=%s name=%s", dtype, dev_name)
+            if debug:
+                _LOGGER.debug("processing device type=%s name=%s", dtype, dev_name)
 
+            handler_name, handler = _HANDLERS.get(dtype, _GENERIC_HANDLER)
             created_for_device: List[Any] = []
-
-            if dtype == "1":
-                try:
-                    created_for_device = await device_type_1_sensor.async_create_device_entities(
-                        coordinator,
-                        entry,
-                        dev,
-                    )
+            try:
+                created_for_device = await handler(coordinator, entry, dev)
+                if debug:
                     _LOGGER.debug(
-                        "device_type_1 handler created %d entities for %s",
+                        "%s handler created %d entities for %s",
+                        handler_name,
                         len(created_for_device),
                         dev_name,
                     )
-                except Exception as exc:  # noqa: BLE001
-                    _LOGGER.exception(
-                        "device_type_1 handler failed for %s: %s",
-                        dev_name,
-                        exc,
-                    )
-
-            elif dtype == "4":
-                try:
-                    created_for_device = await device_type_4_sensor.async_create_device_entities(
-                        coordinator,
-                        entry,
-                        dev,
-                    )
-                    _LOGGER.debug(
-                        "device_type_4 handler created %d entities for %s",
-                        len(created_for_device),
-                        dev_name,
-                    )
-                except Exception as exc:  # noqa: BLE001
-                    _LOGGER.exception(
-                        "device_type_4 handler failed for %s: %s",
-                        dev_name,
-                        exc,
-                    )
-
-            elif dtype == "5":
-                try:
-                    created_for_device = await device_type_5_sensor.async_create_device_entities(
-                        coordinator,
-                        entry,
-                        dev,
-                    )
-                    _LOGGER.debug(
-                        "device_type_5 handler created %d entities for %s",
-                        len(created_for_device),
-                        dev_name,
-                    )
-                except Exception as exc:  # noqa: BLE001
-                    _LOGGER.exception(
-                        "device_type_5 handler failed for %s: %s",
-                        dev_name,
-                        exc,
-                    )
-
-            else:
-                # handler missing or unknown type -> try generic fallback
-                try:
-                    created_for_device = await device_generic_sensor.async_create_device_entities(
-                        coordinator,
-                        entry,
-                        dev,
-                    )
-                    _LOGGER.debug(
-                        "generic device handler created %d entities for %s (type=%s)",
-                        len(created_for_device),
-                        dev_name,
-                        dtype,
-                    )
-                except Exception as exc:  # noqa: BLE001
-                    _LOGGER.exception(
-                        "generic device handler failed for %s (type=%s): %s",
-                        dev_name,
-                        dtype,
-                        exc,
-                    )
+            except Exception as exc:  # noqa: BLE001
+                _LOGGER.exception(
+                    "%s handler failed for %s (type=%s): %s",
+                    handler_name,
+                    dev_name,
+                    dtype,
+                    exc,
+                )
 
-            if created_for_device:
-                entities.extend(created_for_device)
-            else:
+            if not created_for_device and debug:
                 _LOGGER.debug(
                     "no entities created for device %s (type=%s)",
                     dev_name,
                     dtype,
                 )
+            return created_for_device
 
         except Exception as exc:  # noqa: BLE001
             _LOGGER.exception("unexpected error while processing device: %s", exc)
+            return []
+
+    # 1) master-level sensors + 2) device-level sensors
+    devices_list = coordinator.data.get("devices") if coordinator.data else []
+    if not isinstance(devices_list, (list, tuple)):
+        _LOGGER.debug("devices_list is not a list/tuple -> ignoring")
+        devices_list = []
+
+    _LOGGER.debug("creating device sensors for %d devices", len(devices_list))
 
-    # 3) final add
-    try:
-        _LOGGER.debug("calling async_add_entities (count=%d)", len(entities))
-        async_add_entities(entities or [], True)
-    except Exception as exc:  # noqa: BLE001
-        _LOGGER.exception("async_add_entities failed: %s", exc)
+    async def _create_and_add(created_coro: Awaitable[List[Any]]) -> int:
+        """Register one handler's entities as soon as they are created."""
+        created = await created_coro
+        if not created:
+            return 0
+        try:
+            async_add_entities(created, update_before_add=False)
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.exception("async_add_entities failed: %s", exc)
+            return 0
+        return len(created)
+
+    # 3) run all handlers concurrently and add each result as its own chunk;
+    #    every handler logs and swallows its own errors
+    results = await asyncio.gather(
+        _create_and_add(_create_master()),
+        *(_create_and_add(_create_for_device(dev)) for dev in devices_list),
+        return_exceptions=True,
+    )
+    _LOGGER.debug(
+        "added %d sensor entities",
+        sum(result for result in results if isinstance(result, int)),
+    )
 
     _LOGGER.debug("async_setup_entry finished for entry_id=%s", entry.entry_id)
 # End Of File
@@ -9,7 +9,9 @@
 
 from __future__ import annotations
 
-from typing import Any, List, Dict
+from typing import Any, Awaitable, Callable, Dict, List
+from itertools import chain
+import asyncio
 import logging
 
 from homeassistant.core import HomeAssistant
@@ -23,6 +25,12 @@ from .devices.device_type_4 import switch as dev_type_4_switch
 
 _LOGGER = logging.getLogger(__name__)
 
+# deviceType -> per-device switch entity factory; other types have no switches
+_DEVICE_SWITCH_FACTORIES: Dict[str, Callable[..., Awaitable[List[Any]]]] = {
+    "1": dev_type_1_switch.async_create_device_entities,  # Boiler
+    "4": dev_type_4_switch.async_create_device_entities,  # Charger
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,132 +43,105 @@ async def async_setup_entry(
     runtime_data = entry.runtime_data
     if runtime_data is None:
         _LOGGER.debug("switch: runtime_data missing for entry %s", entry.entry_id)
-        async_add_entities([], True)
         return
 
     coordinator = runtime_data.coordinator
     client = runtime_data.client
-    devices: List[Dict[str, Any]] = (
-        coordinator.data.get("devices") if coordinator.data else []
-    ) or []
+    # per-device debug lines are skipped entirely unless DEBUG is enabled
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+    data = coordinator.data or {}
+    devices: List[Dict[str, Any]] = data.get("devices") or []
     if not isinstance(devices, (list, tuple)):
         _LOGGER.debug("switch: devices is not a list/tuple -> ignoring")
         devices = []
 
-    entities: List[Any] = []
-
     try:
         _migrate_boiler_switch_names(hass, entry, devices)
     except Exception as exc:  # noqa: BLE001
         _LOGGER.debug("switch: name migration skipped due to error: %s", exc)
 
-    # -----------------------------------------------------------------------
-    # Master switches
-    # -----------------------------------------------------------------------
-    try:
-        master_entities: List[Any] = await master_switch.async_create_entities(
-            coordinator,
-            entry,
-            client,
-        )
-        if master_entities:
-            entities.extend(master_entities)
-            _LOGGER.debug(
-                "switch: created %d master switch entities",
-                len(master_entities),
-            )
-    except Exception as exc:  # noqa: BLE001
-        _LOGGER.exception("switch: failed to create master entities: %s", exc)
-
     # -----------------------------------------------------------------------
     # Device switches (deviceType 1, 4, ...)
     # -----------------------------------------------------------------------
     _LOGGER.debug("switch: creating device switches for %d devices", len(devices))
 
+    # Only devices with a switch factory get a job; sensor-only types are
+    # dropped here. Entries are validated dicts (see api._valid_devices).
+    device_jobs: List[tuple] = []
     for dev in devices:
-        try:
-            if not isinstance(dev, dict):
-                _LOGGER.debug("switch: skipping non-dict device entry: %r", dev)
-                continue
-
-            dev_type = str(dev.get("deviceType", "")).strip()
-            common = dev.get("common", {}) or {}
-            dev_id = common.get("id")
-            dev_name = common.get("name", f"device-{dev_id}")
-
-            created_for_device: List[Any] = []
-
-            if dev_type == "1":
-                # Boiler – device_type_1
-                try:
-                    created_for_device = await dev_type_1_switch.async_create_device_entities(
-                        coordinator,
-                        entry,
-                        client,
-                        dev,
-                    )
-                    _LOGGER.debug(
-                        "switch: created %d switch entities for deviceType=1 (id=%s, name=%s)",
-                        len(created_for_device),
-                        dev_id,
-                        dev_name,
-                    )
-                except Exception as exc:  # noqa: BLE001
-                    _LOGGER.exception(
-                        "switch: failed to create switches for deviceType=1 (id=%s, name=%s): %s",
-                        dev_id,
-                        dev_name,
-                        exc,
-                    )
-
-            elif dev_type == "4":
-                # Charger – device_type_4
-                try:
-                    created_for_device = await dev_type_4_switch.async_create_device_entities(
-                        coordinator,
-                        entry,
-                        client,
-                        dev,
-                    )
-                    _LOGGER.debug(
-                        "switch: created %d switch entities for deviceType=4 (id=%s, name=%s)",
-                        len(created_for_device),
-                        dev_id,
-                        dev_name,
-                    )
-                except Exception as exc:  # noqa: BLE001
-                    _LOGGER.exception(
-                        "switch: failed to create switches for deviceType=4 (id=%s, name=%s): %s",
-                        dev_id,
-                        dev_name,
-                        exc,
-                    )
-
-            else:
+        dev_type = str(dev.get("deviceType", "")).strip()
+        factory = _DEVICE_SWITCH_FACTORIES.get(dev_type)
+        if factory is None:
+            if debug:
                 _LOGGER.debug(
-                    "switch: no device switch factory for deviceType=%s (id=%s, name=%s)",
+                    "switch: no device switch factory for deviceType=%s",
                     dev_type,
-                    dev_id,
-                    dev_name,
                 )
+            continue
+        device_jobs.append((dev_type, dev, factory))
+
+    # Run master and device factories concurrently. Failures come back as
+    # results and are logged below; results keep the input order.
+    results = await asyncio.gather(
+        master_switch.async_create_entities(coordinator, entry, client),
+        *(factory(coordinator, entry, client, dev) for _, dev, factory in device_jobs),
+        return_exceptions=True,
+    )
+
+    # a cancelled factory means setup itself is being cancelled
+    for result in results:
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+
+    master_result = results[0]
+    if isinstance(master_result, BaseException):
+        _LOGGER.error(
+            "switch: failed to create master entities: %s",
+            master_result,
+            exc_info=master_result,
+        )
+    elif master_result:
+        _LOGGER.debug(
+            "switch: created %d master switch entities",
+            len(master_result),
+        )
 
-            if created_for_device:
-                entities.extend(created_for_device)
-
-        except Exception as exc:  # noqa: BLE001
-            _LOGGER.exception(
-                "switch: unexpected error while processing device switches: %s",
-                exc,
+    for (dev_type, dev, _), result in zip(device_jobs, results[1:]):
+        if isinstance(result, BaseException):
+            common = dev["common"]
+            _LOGGER.error(
+                "switch: failed to create switches for deviceType=%s (id=%s, name=%s): %s",
+                dev_type,
+                common.get("id"),
+                common.get("name", f"device-{common.get('id')}"),
+                result,
+                exc_info=result,
+            )
+        elif debug:
+            common = dev["common"]
+            _LOGGER.debug(
+                "switch: created %d switch entities for deviceType=%s (id=%s, name=%s)",
+                len(result or ()),
+                dev_type,
+                common.get("id"),
+                common.get("name", f"device-{common.get('id')}"),
             )
 
+    entities: List[Any] = list(
+        chain.from_iterable(result for result in results if isinstance(result, list))
+    )
+
     # -----------------------------------------------------------------------
     # Register all entities
     # -----------------------------------------------------------------------
-    try:
-        _LOGGER.debug("switch: calling async_add_entities (count=%d)", len(entities))
-        async_add_entities(entities or [], True)
-    except Exception as exc:  # noqa: BLE001
-        _LOGGER.exception("switch: async_add_entities failed: %s", exc)
+    if entities:
+        try:
+            _LOGGER.debug("switch: calling async_add_entities (count=%d)", len(entities))
+            async_add_entities(entities, update_before_add=False)
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.exception("switch: async_add_entities failed: %s", exc)
+    else:
+        _LOGGER.debug("switch: no switch entities to add")
 
     _LOGGER.debug("switch.async_setup_entry finished for entry_id=%s", entry.entry_id)
 